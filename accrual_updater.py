@@ -17,12 +17,19 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import multiprocessing
 import os
 import re
 import shutil
+import string
 import subprocess
 import sys
+import threading
 import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
 from fractions import Fraction
 from typing import Any, Dict, List, Optional, Tuple
@@ -36,6 +43,7 @@ except Exception:
     sys.exit(1)
 
 try:
+    import numpy as np
     import pandas as pd
 except Exception:
     print("ERROR: Missing pandas. Install: pip install pandas")
@@ -54,10 +62,19 @@ try:
 except Exception:
     SUPPORT_XLS = False
 
+# Admin fee calculation and paysheet discovery are shared with the standalone v18b module
+from admin_fee_module_v18b import (
+    PAYSHEET_EXTS,
+    calculate_admin_fee_for_paysheet,
+    iter_paysheet_files,
+    safe_float,
+)
+
 MONTHS = [
     "January", "February", "March", "April", "May", "June",
     "July", "August", "September", "October", "November", "December"
 ]
+MONTH_INDEX = {name: i for i, name in enumerate(MONTHS, 1)}  # "January" -> 1
 
 __version__ = "7.0.3"
 __author__ = "ravitejavavilala07-source"
@@ -71,7 +88,11 @@ __date__ = "2025-11-28 18:00:00"
 def year_in_sheet_name(year: int, name: str) -> bool:
     """Word-boundary year match. '2030' matches '2030', '2030-Closed', 'FY 2030'.
     Does NOT match '12030', '2029-2030' (substring trap), or '20300'."""
-    return bool(re.search(rf'(?<!\d){year}(?!\d)', str(name)))
+    name = str(name)
+    # Cheap literal check first; most tab names don't contain the year at all
+    if str(year) not in name:
+        return False
+    return bool(re.search(rf'(?<!\d){year}(?!\d)', name))
 
 
 def select_year_sheet(book_or_items, year: int):
@@ -92,40 +113,31 @@ def select_year_sheet(book_or_items, year: int):
     return candidates[0][1]
 
 
-def safe_float(x: Any) -> float:
-    """Convert any value to float safely"""
-    try:
-        if x is None:
-            return 0.0
-        if isinstance(x, (int, float)):
-            return float(x)
-        s = str(x).strip().replace(",", "").replace("$", "")
-        s = s.replace("(", "-").replace(")", "")
-        if s in ("", "-"):
-            return 0.0
-        m = re.search(r"-?\d+(?:\.\d+)?", s)
-        return float(m.group(0)) if m else 0.0
-    except Exception:
-        return 0.0
+_DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d", "%Y/%m/%d", "%m-%d-%Y", "%m-%d-%y")
+_DATE_FALLBACK_RE = re.compile(r'^\s*0?(\d{1,2})[/-]0?(\d{1,2})[/-](\d{2,4})\s*$')
 
 
+@functools.lru_cache(maxsize=16384)
 def _normalize_input_date_to_dateobj(s: Optional[str]) -> Optional[date]:
-    """Parse date string to date object"""
+    """Parse date string to date object.
+
+    Memoized: paysheet scans feed the same handful of date strings through
+    here thousands of times, and date objects are immutable.
+    """
     if s is None:
         return None
     s = str(s).strip()
     if not s:
         return None
     
-    fmts = ("%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d", "%Y/%m/%d", "%m-%d-%Y", "%m-%d-%y")
-    for fmt in fmts:
+    for fmt in _DATE_FORMATS:
         try:
             dt = datetime.strptime(s, fmt)
             return date(dt.year, dt.month, dt.day)
         except Exception:
             pass
     
-    m = re.match(r'^\s*0?(\d{1,2})[/-]0?(\d{1,2})[/-](\d{2,4})\s*$', s)
+    m = _DATE_FALLBACK_RE.match(s)
     if m:
         mm = int(m.group(1))
         dd = int(m.group(2))
@@ -164,267 +176,10 @@ def parse_multiplier_input(s: str) -> float:
 # SECTION 1: ADMIN FEE MODULE (from v7.5.0)
 # ==============================================================================
 
-def extract_period_dates(period_str: str) -> Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]:
-    """Extract period date range from 'MM/DD-MM/DD/YYYY' format"""
-    match = re.match(r'(\d{1,2})/(\d{1,2})\s*[-/]\s*(\d{1,2})[-/](\d{1,2})[-/](\d{4})', period_str)
-    if match:
-        return ((int(match.group(1)), int(match.group(2)), int(match.group(5))), 
-                (int(match.group(3)), int(match.group(4)), int(match.group(5))))
-    return None
-
-
-def extract_single_date(date_str: str) -> Optional[Tuple[int, int, int]]:
-    """Extract single date from MM/DD/YYYY format"""
-    match = re.match(r'(\d{1,2})/(\d{1,2})/(\d{2,4})', date_str)
-    if match:
-        month, day, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
-        if year < 100: year += 2000
-        return (month, day, year)
-    return None
-
-
-def parse_admin_fee_eff_date(text: str) -> Optional[Tuple[int, int, int]]:
-    """Parse date from 'Admin Fee Eff MM/DD/YYYY' text"""
-    match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{2,4})', text)
-    if match:
-        month, day, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
-        if year < 100: year += 2000
-        return (month, day, year)
-    return None
-
-
-def find_admin_fee_eff(sheet, header_row: int, search_rows: int = 10) -> list:
-    """Find ALL 'Admin Fee Eff' entries"""
-    admin_fees = []
-    search_start = max(0, header_row - search_rows)
-    
-    for r in range(search_start, header_row):
-        for c in range(sheet.ncols):
-            cell_val = sheet.cell_value(r, c)
-            if cell_val and "admin fee eff" in str(cell_val).lower():
-                date_tuple = parse_admin_fee_eff_date(str(cell_val))
-                if date_tuple and c + 1 < sheet.ncols:
-                    rate = safe_float(sheet.cell_value(r, c + 1))
-                    if rate > 0:
-                        admin_fees.append((date_tuple, rate))
-    
-    admin_fees.sort(key=lambda x: (x[0][2], x[0][0], x[0][1]))
-    return admin_fees
-
-
-def find_static_admin_fee(sheet, header_row: int, search_rows: int = 10) -> float:
-    """Find static 'Admin Fee'"""
-    search_start = max(0, header_row - search_rows)
-    
-    for r in range(search_start, header_row):
-        for c in range(sheet.ncols):
-            cell_val = sheet.cell_value(r, c)
-            if cell_val:
-                text = str(cell_val).lower().strip()
-                if text in ('admin fee', 'adminfee') and 'eff' not in text:
-                    if c + 1 < sheet.ncols:
-                        rate = safe_float(sheet.cell_value(r, c + 1))
-                        if rate > 0:
-                            return rate
-    return 0.0
-
-
-def get_rate_for_date(admin_fees: list, period_date: Tuple[int, int, int]) -> float:
-    """Get applicable rate for a specific date"""
-    applicable_rate = 0.0
-    for date_tuple, rate in admin_fees:
-        eff_comp = (date_tuple[2], date_tuple[0], date_tuple[1])
-        period_comp = (period_date[2], period_date[0], period_date[1])
-        if eff_comp <= period_comp:
-            applicable_rate = rate
-        else:
-            break
-    return applicable_rate
-
-
-def is_full_month_period(start_date: Tuple[int, int, int], end_date: Tuple[int, int, int]) -> bool:
-    """Check if period is a full month"""
-    if start_date[0] != end_date[0]:
-        return False
-    if start_date[1] != 1:
-        return False
-    if end_date[1] < 28:
-        return False
-    return True
-
-
-def has_mid_month_eff(admin_fees_list: list, month: int) -> bool:
-    """Check if Admin Fee Eff is mid-month"""
-    for date_tuple, rate in admin_fees_list:
-        if date_tuple[0] == month and date_tuple[1] > 1:
-            return True
-    return False
-
-
-def get_full_month_eff_rate(admin_fees_list: list, month: int) -> float:
-    """Get the Eff rate for full month periods"""
-    latest_rate = 0.0
-    for date_tuple, rate in admin_fees_list:
-        if date_tuple[0] == month and date_tuple[1] > 1:
-            latest_rate = rate
-    return latest_rate
-
-
-def calculate_admin_fee_for_paysheet(paysheet_path: str, month: int, year: int, debug: bool = False) -> Tuple[float, float, float]:
-    """
-    Calculate admin fee from paysheet (v7.5.0 logic)
-    Returns: (total_hours, last_rate, total_admin_fee)
-    """
-    total_hours = 0.0
-    total_admin_fee = 0.0
-    last_rate = 0.0
-    
-    try:
-        book = xlrd.open_workbook(paysheet_path, formatting_info=False)
-        sheet = None
-        for s in book.sheets():
-            if year_in_sheet_name(year, s.name):
-                sheet = s
-                break
-        if not sheet:
-            return 0.0, 0.0, 0.0
-        
-        headers = []
-        for r in range(sheet.nrows):
-            for c in range(sheet.ncols):
-                val = sheet.cell_value(r, c)
-                if val:
-                    text = str(val).lower().strip()
-                    if text == 'work period' or text == 'hours & payment':
-                        headers.append((r, c, text))
-                        break
-        
-        if not headers:
-            return 0.0, 0.0, 0.0
-        
-        for section_idx, (hp_row, hp_col, header_type) in enumerate(headers):
-            section_end = sheet.nrows
-            
-            for r in range(hp_row + 1, sheet.nrows):
-                cell_val = sheet.cell_value(r, hp_col)
-                if not cell_val:
-                    continue
-                cell_str = str(cell_val).strip().lower()
-                
-                if any(x in cell_str for x in ['total', 'admin fees', 'deductions']):
-                    section_end = r
-                    break
-                
-                if section_idx < len(headers) - 1:
-                    next_hp_row = headers[section_idx + 1][0]
-                    if r >= next_hp_row - 5:
-                        section_end = r
-                        break
-            
-            admin_fees_list = find_admin_fee_eff(sheet, hp_row, search_rows=10)
-            static_rate = find_static_admin_fee(sheet, hp_row, search_rows=10)
-            
-            if admin_fees_list and static_rate > 0:
-                admin_fees_list = [((1, 1, year), static_rate)] + admin_fees_list
-            
-            if admin_fees_list:
-                section_hours = 0.0
-                section_fee = 0.0
-                section_rate = 0.0
-                
-                has_mid_month = has_mid_month_eff(admin_fees_list, month)
-                full_month_eff_rate = get_full_month_eff_rate(admin_fees_list, month)
-                
-                for r in range(hp_row + 1, section_end):
-                    period_text = sheet.cell_value(r, hp_col)
-                    if not period_text:
-                        continue
-                    period_str = str(period_text).strip().lower()
-                    
-                    period_dates = extract_period_dates(period_str)
-                    single_date = None
-                    
-                    if not period_dates:
-                        single_date = extract_single_date(period_str)
-                    
-                    if period_dates:
-                        start_date, end_date = period_dates
-                        if start_date[0] != month or start_date[2] != year:
-                            continue
-                        
-                        hours_val = safe_float(sheet.cell_value(r, hp_col + 1))
-                        if hours_val <= 0:
-                            continue
-                        
-                        if is_full_month_period(start_date, end_date) and has_mid_month:
-                            rate = full_month_eff_rate
-                        else:
-                            rate = get_rate_for_date(admin_fees_list, start_date)
-                        
-                        fee = hours_val * rate if rate > 0 else 0.0
-                        
-                        if fee > 0:
-                            section_hours += hours_val
-                            section_fee += fee
-                            section_rate = rate
-                    
-                    elif single_date:
-                        if single_date[0] != month or single_date[2] != year:
-                            continue
-                        
-                        amount_val = safe_float(sheet.cell_value(r, hp_col + 1))
-                        
-                        if amount_val <= 0:
-                            continue
-                        
-                        rate = get_rate_for_date(admin_fees_list, single_date)
-                        
-                        if rate > 0:
-                            fee = amount_val
-                            section_hours += 1
-                            section_fee += fee
-                            section_rate = rate
-                
-                if section_hours > 0:
-                    total_hours += section_hours
-                    total_admin_fee += section_fee
-                    last_rate = section_rate
-                continue
-            
-            if static_rate > 0:
-                section_hours = 0.0
-                
-                for r in range(hp_row + 1, section_end):
-                    period_text = sheet.cell_value(r, hp_col)
-                    if not period_text:
-                        continue
-                    period_str = str(period_text).strip().lower()
-                    
-                    period_dates = extract_period_dates(period_str)
-                    if not period_dates:
-                        continue
-                    
-                    start_date = period_dates[0]
-                    if start_date[0] != month or start_date[2] != year:
-                        continue
-                    
-                    hours_val = safe_float(sheet.cell_value(r, hp_col + 1))
-                    if hours_val > 0:
-                        section_hours += hours_val
-                
-                if section_hours > 0:
-                    section_fee = section_hours * static_rate
-                    total_hours += section_hours
-                    total_admin_fee += section_fee
-                    last_rate = static_rate
-        
-        return float(total_hours), float(last_rate), float(total_admin_fee)
-    
-    except Exception as e:
-        import traceback
-        print(f"⚠️  Admin fee calc failed for {paysheet_path}: {e}")
-        traceback.print_exc()
-        return 0.0, 0.0, 0.0
+def _report_admin_fee_failure(paysheet_path: str, exc: Exception) -> None:
+    """on_error hook for calculate_admin_fee_for_paysheet: message plus traceback"""
+    print(f"⚠️  Admin fee calc failed for {paysheet_path}: {exc}")
+    traceback.print_exc()
 
 
 def _is_date_cell_empty(cell_value: Any) -> bool:
@@ -435,13 +190,16 @@ def _is_date_cell_empty(cell_value: Any) -> bool:
     return s == "" or s.lower() == "none"
 
 
+_ADJUSTMENT_KEYWORD_RE = re.compile(r'retro|ach', re.IGNORECASE)
+
+
 def _other_cell_contains_keyword(text: Any) -> bool:
     """Check for retro/ACH keywords"""
     try:
         if text is None:
             return False
-        s = str(text).lower()
-        return ('retro' in s) or ('ach' in s)
+        s = text if isinstance(text, str) else str(text)
+        return _ADJUSTMENT_KEYWORD_RE.search(s) is not None
     except Exception:
         return False
 
@@ -457,36 +215,32 @@ def calculate_gross_salary_for_paysheet(paysheet_path: str, month: int, year: in
         if not SUPPORT_XLS or not paysheet_path.endswith('.xls'):
             return 0.0
         
-        book = xlrd.open_workbook(paysheet_path, formatting_info=False)
-        sheet = None
-        for s in book.sheets():
-            if year_in_sheet_name(year, s.name):
-                sheet = s
-                break
+        sheet = wb_cache.xls_year_sheet(paysheet_path, year)
         if not sheet:
             return 0.0
         
         # Find all "Gross" entries and consolidate split cells
-        for r in range(sheet.nrows):
-            for c in range(sheet.ncols):
-                cell_val = sheet.cell_value(r, c)
+        nrows, ncols = sheet.nrows, sheet.ncols
+        for r in range(nrows):
+            row = sheet.row_values(r)
+            for c, cell_val in enumerate(row):
                 if cell_val:
                     text = str(cell_val).lower().strip()
                     if 'gross' in text and ('salary' in text or 'pay' in text or text == 'gross'):
-                        if c + 1 < sheet.ncols:
+                        if c + 1 < ncols:
                             # Get the main amount
-                            gross_val = safe_float(sheet.cell_value(r, c + 1))
+                            gross_val = safe_float(row[c + 1])
                             
                             section_total = gross_val
                             
                             # Check for split cells below
                             check_row = r + 1
-                            while check_row < sheet.nrows:
+                            while check_row < nrows:
                                 next_label = sheet.cell_value(check_row, c)
                                 
                                 # If label is empty, check for split amount
                                 if _is_date_cell_empty(next_label):
-                                    if c + 1 < sheet.ncols:
+                                    if c + 1 < ncols:
                                         next_amt = safe_float(sheet.cell_value(check_row, c + 1))
                                         if next_amt > 0:
                                             section_total += next_amt
@@ -518,24 +272,19 @@ def calculate_carryforward_for_paysheet(paysheet_path: str, year: int) -> float:
         if not SUPPORT_XLS or not paysheet_path.endswith('.xls'):
             return 0.0
 
-        book = xlrd.open_workbook(paysheet_path, formatting_info=False)
-        sheet = None
-        for s in book.sheets():
-            if year_in_sheet_name(year, s.name):
-                sheet = s
-                break
+        sheet = wb_cache.xls_year_sheet(paysheet_path, year)
         if not sheet:
             return 0.0
 
         for r in range(sheet.nrows):
-            for c in range(sheet.ncols):
-                cell_val = sheet.cell_value(r, c)
+            row = sheet.row_values(r)
+            for c, cell_val in enumerate(row):
                 if cell_val:
                     text = str(cell_val).lower().strip()
                     if 'balance forward' in text or 'carryforward' in text or 'carry forward' in text:
                         # Found label — scan RIGHT, skip year-like ints (1900-2100)
-                        for cc in range(c + 1, sheet.ncols):
-                            amt = safe_float(sheet.cell_value(r, cc))
+                        for cc in range(c + 1, len(row)):
+                            amt = safe_float(row[cc])
                             if amt == 0.0:
                                 continue
                             # Skip values that look like a year, not a balance
@@ -552,69 +301,242 @@ def calculate_carryforward_for_paysheet(paysheet_path: str, year: int) -> float:
 # SECTION 2: PAYSHEET PARSING (from v7.0.1)
 # ==============================================================================
 
+class WorkbookCache:
+    """Small LRU of parsed paysheets, keyed by path.
+
+    A single run opens each paysheet several times (hours/billed parse, one AB
+    lookup per pay date, prior-month validation). Entries are dropped when the
+    file's mtime or size changes. Cached books and DataFrames are shared, so
+    callers must treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = 16):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _entry(self, path: str) -> Dict[str, Any]:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = os.path.abspath(path)
+        entry = self._entries.get(key)
+        if entry is None or entry["stamp"] != stamp:
+            if entry is not None:
+                self._close(entry)
+            entry = {"stamp": stamp, "frames": {}}
+            self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            _, old = self._entries.popitem(last=False)
+            self._close(old)
+        return entry
+
+    @staticmethod
+    def _close(entry: Dict[str, Any]):
+        xf = entry.get("excel_file")
+        if xf is not None:
+            try:
+                xf.close()
+            except Exception:
+                pass
+        book = entry.get("xlrd_book")
+        if book is not None:
+            try:
+                book.release_resources()
+            except Exception:
+                pass
+
+    def xlrd_book(self, path: str):
+        """xlrd Book for an .xls file (on_demand, formatting_info=False)"""
+        if not SUPPORT_XLS:
+            raise RuntimeError("xlrd not available")
+        with self._lock:
+            entry = self._entry(path)
+            if "xlrd_book" not in entry:
+                # on_demand: sheets load when first touched (parse_paysheet only needs
+                # the year tab); the cache releases the book on eviction
+                entry["xlrd_book"] = xlrd.open_workbook(path, formatting_info=False, on_demand=True)
+            return entry["xlrd_book"]
+
+    def xls_sheet_names(self, path: str) -> List[str]:
+        """Sheet names of an .xls file"""
+        return self.xlrd_book(path).sheet_names()
+
+    def xls_year_sheet(self, path: str, year: int):
+        """First .xls sheet whose name contains the year, or None (only that sheet is loaded)"""
+        with self._lock:
+            book = self.xlrd_book(path)
+            for idx, name in enumerate(book.sheet_names()):
+                if year_in_sheet_name(year, name):
+                    return book.sheet_by_index(idx)
+            return None
+
+    def xls_frame(self, path: str, sheet_name: str) -> Optional[pd.DataFrame]:
+        """One .xls sheet as a DataFrame (dates as m/d/Y); None if it holds no data"""
+        with self._lock:
+            book = self.xlrd_book(path)
+            frames = self._entry(path).setdefault("xls_frames", {})
+            if sheet_name not in frames:
+                frames[sheet_name] = _xls_sheet_to_frame(book, book.sheet_by_name(sheet_name))
+            return frames[sheet_name]
+
+    def xls_frames(self, path: str) -> Dict[str, pd.DataFrame]:
+        """All .xls sheets that hold data, in workbook order"""
+        with self._lock:
+            out: Dict[str, pd.DataFrame] = {}
+            for name in self.xls_sheet_names(path):
+                df = self.xls_frame(path, name)
+                if df is not None:
+                    out[name] = df
+            return out
+
+    def _excel_file(self, entry: Dict[str, Any], path: str) -> pd.ExcelFile:
+        xf = entry.get("excel_file")
+        if xf is None:
+            try:
+                xf = pd.ExcelFile(path, engine=None)
+            except Exception:
+                xf = pd.ExcelFile(path, engine="openpyxl")
+            entry["excel_file"] = xf
+        return xf
+
+    def sheet_names(self, path: str) -> List[str]:
+        """Sheet names via pandas.ExcelFile, without parsing any sheet"""
+        with self._lock:
+            entry = self._entry(path)
+            return list(self._excel_file(entry, path).sheet_names)
+
+    def frame(self, path: str, sheet_name: str) -> pd.DataFrame:
+        """One sheet, parsed on first use and reused afterwards"""
+        with self._lock:
+            entry = self._entry(path)
+            frames = entry["frames"]
+            if sheet_name not in frames:
+                frames[sheet_name] = self._excel_file(entry, path).parse(sheet_name)
+            return frames[sheet_name]
+
+    def frames(self, path: str) -> Dict[str, pd.DataFrame]:
+        """All sheets, like pd.read_excel(path, sheet_name=None)"""
+        with self._lock:
+            return {name: self.frame(path, name) for name in self.sheet_names(path)}
+
+    def clear(self):
+        """Drop every entry and release open file handles"""
+        with self._lock:
+            for entry in self._entries.values():
+                self._close(entry)
+            self._entries.clear()
+
+
+wb_cache = WorkbookCache()
+
+
 def read_xls_with_xlrd(path: str) -> Dict[str, pd.DataFrame]:
-    """Read .xls file using xlrd"""
+    """Read .xls file using xlrd (shared via wb_cache; treat frames as read-only)"""
     if not SUPPORT_XLS:
         raise RuntimeError("xlrd not available")
-    
-    book = xlrd.open_workbook(path, formatting_info=False, on_demand=False)
-    out: Dict[str, pd.DataFrame] = {}
-    
-    for sheet in book.sheets():
-        rows = []
-        for r in range(sheet.nrows):
-            try:
-                row_vals = []
-                has_data = False
-                for c in range(sheet.ncols):
+    return wb_cache.xls_frames(path)
+
+
+def _xls_sheet_to_frame(book, sheet) -> Optional[pd.DataFrame]:
+    """Convert one xlrd sheet to a DataFrame (first row = header); None if empty"""
+    rows = []
+    date_type = xlrd.XL_CELL_DATE
+    for r in range(sheet.nrows):
+        # Whole-row reads: empty cells come back as "", matching the old per-cell loop
+        row_vals = sheet.row_values(r)
+        if not any(v != "" for v in row_vals):
+            continue
+        row_types = sheet.row_types(r)
+        if date_type in row_types:
+            for c, ctype in enumerate(row_types):
+                if ctype == date_type:
+                    v = row_vals[c]
                     try:
-                        v = sheet.cell_value(r, c)
-                        ctype = sheet.cell_type(r, c)
-                        
-                        if ctype == xlrd.XL_CELL_DATE:
-                            try:
-                                dt_tuple = xlrd.xldate_as_tuple(v, book.datemode)
-                                row_vals.append(f"{dt_tuple[1]}/{dt_tuple[2]}/{dt_tuple[0]}")
-                                has_data = True
-                            except Exception:
-                                row_vals.append(str(v))
-                                if v != "":
-                                    has_data = True
-                        elif ctype != xlrd.XL_CELL_EMPTY:
-                            row_vals.append(v)
-                            if v != "":
-                                has_data = True
-                        else:
-                            row_vals.append("")
+                        dt_tuple = xlrd.xldate_as_tuple(v, book.datemode)
+                        row_vals[c] = f"{dt_tuple[1]}/{dt_tuple[2]}/{dt_tuple[0]}"
                     except Exception:
-                        row_vals.append("")
-                
-                if has_data:
-                    rows.append(row_vals)
-            except Exception:
+                        row_vals[c] = str(v)
+        rows.append(row_vals)
+
+    if not rows:
+        return None
+    df = pd.DataFrame(rows)
+    if not df.empty:
+        df.columns = [str(x) if x is not None else "" for x in df.iloc[0].tolist()]
+        df = df.iloc[1:].reset_index(drop=True)
+    return df
+
+
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+# Plain pattern string (not compiled) so pandas .str.contains accepts it on every backend
+_PERIOD_BLACKLIST_PATTERN = r'\b(?:discount|rate|admin\s*fee|tax|employer|deduct)\b'
+
+
+def _month_prefixes(month: int) -> Tuple[str, ...]:
+    """Literal prefixes ("05", "5") a period for the given month can start with"""
+    return (f"{month:02d}", str(month))
+
+
+def _starts_with_month(text: str, prefixes: Tuple[str, ...]) -> bool:
+    """Stripped text starts with a month prefix that isn't followed by a word character.
+
+    Same result as re.match(rf'^\s*(?:MM|M)(?:[/-]|\b)', text) on stripped text.
+    """
+    for p in prefixes:
+        if text.startswith(p):
+            nxt = text[len(p):len(p) + 1]
+            return not nxt or not (nxt.isalnum() or nxt == '_')
+    return False
+
+
+def _first_numeric_token_from_text(s: Any) -> Optional[int]:
+    """First 1-2 digit number in the text once ASCII letters are dropped"""
+    if s is None:
+        return None
+    # Single walk: letters are skipped in place (so "1st2" reads as 12)
+    digits = ''
+    for ch in str(s):
+        if ch.isdecimal():
+            digits += ch
+            if len(digits) == 2:
                 break
-        
-        if rows:
-            df = pd.DataFrame(rows)
-            if not df.empty:
-                df.columns = [str(x) if x is not None else "" for x in df.iloc[0].tolist()]
-                df = df.iloc[1:].reset_index(drop=True)
-            out[sheet.name] = df
-    
-    return out
+        elif digits and ch not in _ASCII_LETTERS:
+            break
+    return int(digits) if digits else None
+
+
+def _sum_period_rows(keep, hours, payments, payment_min):
+    """Sum hours (0 < h <= 500) and payments (>= payment_min) over kept cells.
+
+    Inputs are flat sequences in scan order (row-major over the B/C columns) and
+    are summed sequentially, so totals match a plain Python loop exactly.
+    """
+    hours_sum = 0.0
+    payments_sum = 0.0
+    for i in range(len(keep)):
+        if keep[i]:
+            h = hours[i]
+            if h > 0.0 and h <= 500.0:
+                hours_sum += h
+                p = payments[i]
+                if p >= payment_min:
+                    payments_sum += p
+    return hours_sum, payments_sum
 
 
 def parse_paysheet(
     path: str,
     month: int,
     year: int,
-    debug_log: List[str],
+    debug_log: Optional[List[str]],
     bc_cols: Optional[List[int]] = None,
     bc_scan_rows: Optional[int] = None,
     bc_payment_min: float = 1.0,
 ) -> Tuple[float, float, Optional[float], Dict[str, Any]]:
-    """Parse paysheet for hours and payments"""
-    debug_log.append(f"PARSING: {os.path.basename(path)}")
+    """Parse paysheet for hours and payments (debug_log=None skips debug lines)"""
+    if debug_log is not None:
+        debug_log.append(f"PARSING: {os.path.basename(path)}")
     hours_sum = 0.0
     payments_sum = 0.0
     salary_candidate = None
@@ -622,113 +544,101 @@ def parse_paysheet(
     
     try:
         ext = os.path.splitext(path)[1].lower()
-        dfs: Dict[str, pd.DataFrame] = {}
-        
+
+        # Pick the year tab by name first and parse only that sheet.
+        # .xls sheets without data never produced a frame, so they don't count.
         if ext == ".xls":
-            dfs = read_xls_with_xlrd(path)
+            selected_names = [
+                n for n in wb_cache.xls_sheet_names(path)
+                if year_in_sheet_name(year, n) and wb_cache.xls_frame(path, n) is not None
+            ]
+            load_sheet = lambda n: wb_cache.xls_frame(path, n)
         else:
-            try:
-                dfs = pd.read_excel(path, sheet_name=None, engine=None)
-            except Exception:
-                dfs = pd.read_excel(path, sheet_name=None, engine="openpyxl")
+            selected_names = [n for n in wb_cache.sheet_names(path) if year_in_sheet_name(year, n)]
+            load_sheet = lambda n: wb_cache.frame(path, n)
 
-        sheet_items = list(dfs.items())
         # Word-boundary year match. Prefer exact-name tab.
-        selected = [(n, d) for (n, d) in sheet_items if year_in_sheet_name(year, n)]
-        if len(selected) > 1:
-            exact = [(n, d) for (n, d) in selected if str(n).strip() == str(year)]
+        if len(selected_names) > 1:
+            exact = [n for n in selected_names if str(n).strip() == str(year)]
             if exact:
-                selected = [exact[0]]
+                selected_names = [exact[0]]
             else:
-                debug_log.append(f"  ⚠️  Multiple year-{year} tabs matched: {[n for n, _ in selected]}. Using first.")
-                selected = [selected[0]]
-        if not selected:
-            debug_log.append(f"  ⚠️  No sheet matching year {year} in {os.path.basename(path)} — skipping (no fallback).")
-            selected = []
+                if debug_log is not None:
+                    debug_log.append(f"  ⚠️  Multiple year-{year} tabs matched: {selected_names}. Using first.")
+                selected_names = [selected_names[0]]
+        if not selected_names:
+            if debug_log is not None:
+                debug_log.append(f"  ⚠️  No sheet matching year {year} in {os.path.basename(path)} — skipping (no fallback).")
+        selected = [(n, load_sheet(n)) for n in selected_names]
 
-        first_num_re = re.compile(r'(\d{1,2})')
-        start_re = re.compile(rf'^\s*(?:{month:02d}|{month})(?:[/-]|\b)')
-
-        def first_numeric_token_from_text(s: Any) -> Optional[int]:
-            if s is None:
-                return None
-            txt = re.sub(r'[A-Za-z]+', '', str(s))
-            m = first_num_re.search(txt)
-            return int(m.group(1)) if m else None
+        month_prefixes = _month_prefixes(month)
 
         for sname, df in selected:
             if df is None or df.shape[1] == 0:
                 continue
             
-            df2 = df.copy()
-            df2.columns = [str(c) if c is not None else "" for c in df2.columns]
-            nrows, ncols = df2.shape
+            # Read-only, positional access only: the frame is shared via wb_cache
+            nrows, ncols = df.shape
 
             bc_cols_use = bc_cols if bc_cols else [1, 2, 3]
             rows_to_scan = nrows if (not bc_scan_rows or bc_scan_rows <= 0) else min(bc_scan_rows, nrows)
             
-            for r in range(rows_to_scan):
-                for col_idx in bc_cols_use:
-                    if col_idx >= ncols:
-                        continue
-                    
-                    raw = df2.iat[r, col_idx]
-                    if raw is None:
-                        continue
-                    
-                    txt_raw = str(raw).strip()
-                    if not txt_raw:
-                        continue
-                    
-                    first_num = first_numeric_token_from_text(txt_raw)
-                    if first_num is None or first_num != month:
-                        continue
+            # Phase 1: column-wise structural filters, then the per-cell checks on
+            # surviving rows only. Results land in (row, B/C column) arrays.
+            keep = np.zeros((rows_to_scan, len(bc_cols_use)), dtype=np.bool_)
+            hours_arr = np.zeros((rows_to_scan, len(bc_cols_use)), dtype=np.float64)
+            payments_arr = np.zeros((rows_to_scan, len(bc_cols_use)), dtype=np.float64)
+            for order, col_idx in enumerate(bc_cols_use):
+                if col_idx >= ncols:
+                    continue
 
+                txt = df.iloc[:rows_to_scan, col_idx].astype(str).str.strip()
+                has_dash = txt.str.contains('-', regex=False, na=False)
+                mask = (
+                    txt.str.match(r'\d', na=False)
+                    # Ensure text contains date-like separators (/ or -)
+                    & txt.str.contains(r'[/-]', na=False)
                     # Skip non-date text like "Discount-1.2%", "Rate", etc.
                     # Word-boundary match avoids dropping legit cells with substrings
-                    txt_lower = txt_raw.lower()
-                    if re.search(r'\b(discount|rate|admin\s*fee|tax|employer|deduct)\b', txt_lower):
-                        continue
-
-                    # Ensure text contains date-like separators (/ or -)
-                    if not ('/' in txt_raw or '-' in txt_raw):
-                        continue
+                    & ~txt.str.lower().str.contains(_PERIOD_BLACKLIST_PATTERN, na=False)
+                    # Slash-only periods must start with the month (boundary checked per row)
+                    & (has_dash | txt.str.startswith(month_prefixes, na=False))
+                )
+                rows = mask.to_numpy(dtype=bool).nonzero()[0]
+                if not len(rows):
+                    continue
+                txt_vals = txt.to_numpy(dtype=object)
+                dash_vals = has_dash.to_numpy(dtype=bool)
 
-                    # Text must start with a digit to be a date period
-                    if not re.match(r'^\s*\d', txt_raw):
-                        continue
+                hours_col = col_idx + 1
+                payment_col = hours_col + 1
+                hours_cells = df.iloc[:rows_to_scan, hours_col].to_numpy(dtype=object) if hours_col < ncols else None
+                payment_cells = df.iloc[:rows_to_scan, payment_col].to_numpy(dtype=object) if payment_col < ncols else None
 
-                    looks_like_period = ('-' in txt_raw)
-                    starts_with_month = bool(start_re.search(txt_raw))
-                    if not (looks_like_period or starts_with_month):
+                for r in rows:
+                    if not dash_vals[r] and not _starts_with_month(txt_vals[r], month_prefixes):
                         continue
-                    
-                    hours_col = col_idx + 1
-                    try:
-                        hours_val = safe_float(df2.iat[r, hours_col]) if hours_col < ncols else 0.0
-                    except Exception:
-                        hours_val = 0.0
-                    
-                    if not (hours_val > 0 and hours_val <= 500):
+                    first_num = _first_numeric_token_from_text(txt_vals[r])
+                    if first_num is None or first_num != month:
                         continue
-                    
-                    payment_val = 0.0
-                    payment_col = hours_col + 1
-                    if payment_col < ncols:
-                        try:
-                            pv = safe_float(df2.iat[r, payment_col])
-                            if pv >= float(bc_payment_min):
-                                payment_val = pv
-                        except Exception:
-                            pass
-                    
-                    hours_sum += hours_val
-                    payments_sum += payment_val
+                    keep[r, order] = True
+                    if hours_cells is not None:
+                        hours_arr[r, order] = safe_float(hours_cells[r])
+                    if payment_cells is not None:
+                        payments_arr[r, order] = safe_float(payment_cells[r])
+
+            # Phase 2: range checks and sums in row-then-column order
+            if keep.any():
+                h, p = _sum_period_rows(keep.ravel().tolist(), hours_arr.ravel().tolist(),
+                                        payments_arr.ravel().tolist(), float(bc_payment_min))
+                hours_sum += h
+                payments_sum += p
 
         return round(hours_sum, 4), round(payments_sum, 2), salary_candidate, meta
     
     except Exception as e:
-        debug_log.append(f"  ✗ ERROR: {e}")
+        if debug_log is not None:
+            debug_log.append(f"  ✗ ERROR: {e}")
         raise RuntimeError(f"Failed parsing {path}: {e}")
 
 
@@ -742,6 +652,28 @@ MONTH_ABBREVIATIONS = {
     "September": "Sep", "October": "Oct", "November": "Nov", "December": "Dec",
 }
 
+# Word-boundary month patterns, compiled once: (abbr, full) per month matching
+# any case, and the lowercase (full, abbr) pair for already-lowered text
+_MONTH_WORD_RES = {
+    full: (re.compile(r'\b' + re.escape(abbr) + r'\b', re.I),
+           re.compile(r'\b' + re.escape(full) + r'\b', re.I))
+    for full, abbr in MONTH_ABBREVIATIONS.items()
+}
+_MONTH_WORD_LOWER_RES = [
+    (re.compile(rf'\b{re.escape(full.lower())}\b'), re.compile(rf'\b{re.escape(abbr.lower())}\b'))
+    for full, abbr in zip(MONTHS, MONTH_ABBREVIATIONS.values())
+]
+
+# 5-6 digit employee file number, as it appears in master cells and file names
+_FILE_NUM_RE = re.compile(r'(\d{5,6})')
+
+
+def _header_row_values(ws: Worksheet, header_row: int) -> Tuple[Any, ...]:
+    """All values of one row in a single iter_rows call (ws.cell is O(rows) in read-only mode)"""
+    row = next(ws.iter_rows(min_row=header_row, max_row=header_row,
+                            max_col=ws.max_column, values_only=True), None)
+    return row or ()
+
 
 def find_headers(ws: Worksheet, header_row: int, month_name: str) -> Dict[str, Optional[int]]:
     """Find column headers - FLEXIBLE MATCHING with month abbreviations.
@@ -753,8 +685,7 @@ def find_headers(ws: Worksheet, header_row: int, month_name: str) -> Dict[str, O
     headers: Dict[str, Optional[int]] = {}
     header_cells: Dict[int, str] = {}
 
-    for c in range(1, ws.max_column + 1):
-        v = ws.cell(row=header_row, column=c).value
+    for c, v in enumerate(_header_row_values(ws, header_row), 1):
         if v not in (None, ""):
             header_cells[c] = str(v).strip()
 
@@ -791,12 +722,10 @@ def find_headers(ws: Worksheet, header_row: int, month_name: str) -> Dict[str, O
         # Tier 2: generic match, but excluding other months' columns
         # Use word-boundary regex to avoid false positives (e.g., "mar" in "margin")
         other_month_patterns = []
-        for m in MONTH_ABBREVIATIONS:
+        for m, pats in _MONTH_WORD_RES.items():
             if m == month_name:
                 continue
-            a = MONTH_ABBREVIATIONS[m]
-            other_month_patterns.append(re.compile(r'\b' + re.escape(a) + r'\b', re.I))
-            other_month_patterns.append(re.compile(r'\b' + re.escape(m) + r'\b', re.I))
+            other_month_patterns.extend(pats)
 
         for c, text in header_cells.items():
             text_lower = text.lower()
@@ -839,8 +768,7 @@ def find_headers(ws: Worksheet, header_row: int, month_name: str) -> Dict[str, O
 def list_all_headers(ws: Worksheet, header_row: int) -> Dict[int, str]:
     """List ALL headers for debugging"""
     headers = {}
-    for c in range(1, ws.max_column + 1):
-        v = ws.cell(row=header_row, column=c).value
+    for c, v in enumerate(_header_row_values(ws, header_row), 1):
         if v not in (None, ""):
             headers[c] = str(v).strip()
     return headers
@@ -850,260 +778,295 @@ def list_all_headers(ws: Worksheet, header_row: int) -> Dict[int, str]:
 # SECTION 4: DATE-BASED AB CALCULATIONS (from v7.5.0)
 # ==============================================================================
 
-def find_amount_for_date_in_paysheet(path: str, target_date: date, debug_log: List[str]) -> float:
-    """Find amount for specific date with split cell consolidation (v7.5.0 logic)"""
-    debug_log.append(f"\n  📅 Searching for: {target_date.strftime('%m/%d/%Y')}")
+class XlrdSheetView:
+    """Cell access to an xlrd sheet for the AB date scan.
+
+    Columns are pulled with col_values/col_types on first use (one call per
+    column instead of one cell_value per cell).
+    """
+
+    def __init__(self, sheet, datemode: int):
+        self.sheet = sheet
+        self.datemode = datemode
+        self.nrows = sheet.nrows
+        self.ncols = sheet.ncols
+        self._cols: Dict[int, List[Any]] = {}
+        self._types: Dict[int, List[int]] = {}
+
+    def value(self, r: int, c: int) -> Any:
+        return self._column(c)[r]
+
+    def candidate_rows(self, c: int, target_date: date) -> Optional[set]:
+        """Rows of column c whose cell is target_date (or would fail to convert).
+
+        Each distinct (value, type) pair is converted once.
+        """
+        flags: Dict[Tuple[Any, int], bool] = {}
+        rows = set()
+        for r, key in enumerate(zip(self._column(c), self._col_types(c))):
+            hit = flags.get(key)
+            if hit is None:
+                try:
+                    hit = self._cell_date(*key) == target_date
+                except Exception:
+                    hit = True
+                flags[key] = hit
+            if hit:
+                rows.add(r)
+        return rows
+
+    def date_at(self, r: int, c: int) -> Optional[date]:
+        return self._cell_date(self._column(c)[r], self._col_types(c)[r])
+
+    def _column(self, c: int) -> List[Any]:
+        col = self._cols.get(c)
+        if col is None:
+            col = self._cols[c] = self.sheet.col_values(c)
+        return col
+
+    def _col_types(self, c: int) -> List[int]:
+        types = self._types.get(c)
+        if types is None:
+            types = self._types[c] = self.sheet.col_types(c)
+        return types
+
+    def _cell_date(self, v: Any, ctype: int) -> Optional[date]:
+        if ctype == xlrd.XL_CELL_DATE:
+            try:
+                dt_tuple = xlrd.xldate_as_tuple(v, self.datemode)
+                return date(dt_tuple[0], dt_tuple[1], dt_tuple[2])
+            except Exception:
+                return None
+        return _normalize_input_date_to_dateobj(str(v))
+
+
+class PandasSheetView:
+    """Cell access to a DataFrame for the AB date scan.
+
+    Columns are pulled as object arrays on first use; indexing those is far
+    cheaper than df.iat and yields the same cell values.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.nrows, self.ncols = df.shape
+        self._cols: Dict[int, Any] = {}
+
+    def value(self, r: int, c: int) -> Any:
+        return self._column(c)[r]
+
+    def candidate_rows(self, c: int, target_date: date) -> Optional[set]:
+        """Rows of column c whose cell is target_date (or would fail to convert).
+
+        The column is factorized once, so each distinct value is normalized
+        once and the match becomes a NumPy mask over the factor codes.
+        """
+        codes, uniques = pd.factorize(self._column(c))
+        # Last slot is for missing cells (code -1). Blanks never hold a date, but
+        # NaT in a datetime column makes date_at raise, so keep those cells and
+        # let the error surface at the same point of the scan as before.
+        flags = np.zeros(len(uniques) + 1, dtype=bool)
+        flags[-1] = self.df.dtypes.iloc[c].kind == "M"
+        for i, u in enumerate(uniques):
+            try:
+                flags[i] = self._cell_date(u) == target_date
+            except Exception:
+                flags[i] = True
+        return set(np.flatnonzero(flags[codes]).tolist())
+
+    def date_at(self, r: int, c: int) -> Optional[date]:
+        return self._cell_date(self.value(r, c))
+
+    def _column(self, c: int):
+        col = self._cols.get(c)
+        if col is None:
+            col = self._cols[c] = self.df.iloc[:, c].to_numpy(dtype=object)
+        return col
+
+    @staticmethod
+    def _cell_date(v: Any) -> Optional[date]:
+        if v is None or (isinstance(v, float) and pd.isna(v)):
+            return None
+        if isinstance(v, (datetime, date)):
+            return date(v.year, v.month, v.day)
+        return _normalize_input_date_to_dateobj(str(v))
+
+
+def _find_amount_in_view(
+    view,
+    target_date: date,
+    debug_log: Optional[List[str]],
+    date_cols: Tuple[int, ...],
+    fallback_cols: Tuple[int, ...] = (),
+    detailed: bool = False,
+) -> Optional[float]:
+    """Find target_date in one sheet and return its consolidated amount (None if absent).
+
+    One row-major pass: a date_cols hit returns straight away; the first
+    fallback_cols hit is only used if date_cols never match in this sheet.
+    detailed=True is the v7.5.0 .xls flavour: log the base row, add retro/ACH
+    adjustment rows and log the FINAL amount.
+    """
+    log = debug_log.append if debug_log is not None else None
+    nrows, ncols = view.nrows, view.ncols
+    scan_cols = [c for c in sorted({*date_cols, *fallback_cols}) if c < ncols]
+    fallback_hit: Optional[Tuple[int, int]] = None
+
+    # Views that can locate matches column-wise narrow the scan to those rows;
+    # None means the view wants every cell visited
+    candidates = {c: view.candidate_rows(c, target_date) for c in scan_cols}
+    if any(rows_c is None for rows_c in candidates.values()):
+        scan_rows = range(nrows)
+    else:
+        scan_rows = sorted(set().union(*candidates.values()))
+
+    for r in scan_rows:
+        for c in scan_cols:
+            rows_c = candidates[c]
+            if rows_c is not None and r not in rows_c:
+                continue
+            is_preferred = c in date_cols
+            if fallback_hit is not None and not is_preferred:
+                continue
+
+            found_date = view.date_at(r, c)
+            if not found_date or found_date != target_date:
+                continue
+            if not is_preferred:
+                fallback_hit = (r, c)
+                continue
+
+            if log:
+                log(f"    ✅ Found at column {get_column_letter(c + 1)}, row {r}")
+
+            amt_col = c + 1
+            base_amt = safe_float(view.value(r, amt_col)) if amt_col < ncols else 0.0
+            if detailed:
+                if log:
+                    log(f"    📍 Row {r}: ${base_amt:.2f}")
+
+            total_amt = base_amt
+            check_row = r + 1
+            consolidated_count = 1
+            consolidated_rows = [r]
+
+            # Consolidate split cells (empty date rows) and repeated same-date rows
+            while check_row < nrows:
+                next_date_cell = view.value(check_row, c)
+
+                if _is_date_cell_empty(next_date_cell):
+                    if amt_col >= ncols:
+                        break
+                    next_amt = safe_float(view.value(check_row, amt_col))
+                    if next_amt > 0:
+                        total_amt += next_amt
+                        consolidated_count += 1
+                        consolidated_rows.append(check_row)
+                        if log:
+                            log(f"    📍 Row {check_row} (SPLIT CELL - empty date): +${next_amt:.2f}")
+                    check_row += 1
+                    continue
+
+                try:
+                    next_date = view.date_at(check_row, c)
+                except Exception:
+                    next_date = None
+
+                if next_date and next_date == target_date:
+                    if amt_col >= ncols:
+                        break
+                    next_amt = safe_float(view.value(check_row, amt_col))
+                    total_amt += next_amt
+                    consolidated_count += 1
+                    consolidated_rows.append(check_row)
+                    if log:
+                        log(f"    📍 Row {check_row} (SAME DATE): +${next_amt:.2f}")
+                    check_row += 1
+                    continue
+
+                break
+
+            if log:
+                log(f"    🔗 Consolidated {consolidated_count} rows: {consolidated_rows}")
+                log(f"    💰 Total: ${total_amt:.2f}")
+
+            if not detailed:
+                return total_amt
+
+            # Check for retro/ACH adjustments
+            total_adjustments = 0.0
+            nr = check_row
+            while nr < nrows and amt_col < ncols:
+                label_cell = view.value(nr, c)
+                if not _other_cell_contains_keyword(label_cell):
+                    break
+                adj_amt = safe_float(view.value(nr, amt_col))
+                total_adjustments += adj_amt
+                if log:
+                    log(f"    🔧 {label_cell} row {nr}: +${adj_amt:.2f}")
+                nr += 1
+
+            if log and total_adjustments > 0:
+                log(f"    🎯 Adjustments: ${total_adjustments:.2f}")
+
+            final_amt = total_amt + total_adjustments
+            if log:
+                log(f"    ✅ FINAL: ${final_amt:.2f}")
+
+            return final_amt
+
+    # Fallback hit (no preferred-column match in this sheet) — with split-cell consolidation
+    if fallback_hit is not None:
+        r, c = fallback_hit
+        amt_col = c + 1
+        total_amt = safe_float(view.value(r, amt_col)) if amt_col < ncols else 0.0
+        check_r = r + 1
+        while check_r < nrows and _is_date_cell_empty(view.value(check_r, c)):
+            next_amt = safe_float(view.value(check_r, amt_col)) if amt_col < ncols else 0.0
+            if next_amt > 0:
+                total_amt += next_amt
+            check_r += 1
+        return total_amt
+
+    return None
+
+
+def find_amount_for_date_in_paysheet(path: str, target_date: date, debug_log: Optional[List[str]]) -> float:
+    """Find amount for specific date with split cell consolidation (v7.5.0 logic)
+
+    debug_log=None skips building the debug lines.
+    """
+    if debug_log is not None:
+        debug_log.append(f"\n  📅 Searching for: {target_date.strftime('%m/%d/%Y')}")
     
     try:
         ext = os.path.splitext(path)[1].lower()
-        preferred_date_cols = [6, 7]
-        fallback_window = range(4, 9)
+        preferred_date_cols = (6, 7)
+        fallback_window = (4, 5, 6, 7, 8)
         
         if ext == ".xls" and SUPPORT_XLS:
-            book = xlrd.open_workbook(path, formatting_info=False, on_demand=True)
+            # .xls keeps the full v7.5.0 behaviour: E..I fallback, retro/ACH adjustments
+            book = wb_cache.xlrd_book(path)
             for sheet in book.sheets():
-                nrows = sheet.nrows
-                ncols = sheet.ncols
-                
-                for r in range(nrows):
-                    for c in preferred_date_cols:
-                        if c >= ncols:
-                            continue
-                        
-                        v = sheet.cell_value(r, c)
-                        cell_type = sheet.cell_type(r, c)
-                        
-                        found_date = None
-                        if cell_type == xlrd.XL_CELL_DATE:
-                            try:
-                                dt_tuple = xlrd.xldate_as_tuple(v, book.datemode)
-                                found_date = date(dt_tuple[0], dt_tuple[1], dt_tuple[2])
-                            except Exception:
-                                pass
-                        else:
-                            found_date = _normalize_input_date_to_dateobj(str(v))
-                        
-                        if found_date and found_date == target_date:
-                            col_letter = get_column_letter(c + 1)
-                            debug_log.append(f"    ✅ Found at column {col_letter}, row {r}")
-                            
-                            amt_col = c + 1
-                            base_amt = 0.0
-                            
-                            if amt_col < ncols:
-                                base_amt = safe_float(sheet.cell_value(r, amt_col))
-                            
-                            debug_log.append(f"    📍 Row {r}: ${base_amt:.2f}")
-                            
-                            total_amt = base_amt
-                            check_row = r + 1
-                            consolidated_count = 1
-                            consolidated_rows = [r]
-                            
-                            # Consolidate split cells (empty date rows)
-                            while check_row < nrows:
-                                next_date_cell = sheet.cell_value(check_row, c)
-                                
-                                if _is_date_cell_empty(next_date_cell):
-                                    next_amt = safe_float(sheet.cell_value(check_row, amt_col))
-                                    if next_amt > 0:
-                                        total_amt += next_amt
-                                        consolidated_count += 1
-                                        consolidated_rows.append(check_row)
-                                        debug_log.append(f"    📍 Row {check_row} (SPLIT CELL - empty date): +${next_amt:.2f}")
-                                        check_row += 1
-                                        continue
-                                    else:
-                                        check_row += 1
-                                        continue
-                                
-                                next_date = None
-                                try:
-                                    if sheet.cell_type(check_row, c) == xlrd.XL_CELL_DATE:
-                                        dt_tuple = xlrd.xldate_as_tuple(next_date_cell, book.datemode)
-                                        next_date = date(dt_tuple[0], dt_tuple[1], dt_tuple[2])
-                                    else:
-                                        next_date = _normalize_input_date_to_dateobj(str(next_date_cell))
-                                except Exception:
-                                    pass
-                                
-                                if next_date and next_date == target_date:
-                                    next_amt = safe_float(sheet.cell_value(check_row, amt_col))
-                                    total_amt += next_amt
-                                    consolidated_count += 1
-                                    consolidated_rows.append(check_row)
-                                    debug_log.append(f"    📍 Row {check_row} (SAME DATE): +${next_amt:.2f}")
-                                    check_row += 1
-                                    continue
-                                
-                                break
-                            
-                            debug_log.append(f"    🔗 Consolidated {consolidated_count} rows: {consolidated_rows}")
-                            debug_log.append(f"    💰 Total: ${total_amt:.2f}")
-                            
-                            # Check for retro/ACH adjustments
-                            total_adjustments = 0.0
-                            nr = check_row
-                            
-                            while nr < nrows:
-                                label_cell = None
-                                if c < ncols:
-                                    label_cell = sheet.cell_value(nr, c)
-                                
-                                if _other_cell_contains_keyword(label_cell):
-                                    if amt_col < ncols:
-                                        adj_amt = safe_float(sheet.cell_value(nr, amt_col))
-                                        total_adjustments += adj_amt
-                                        debug_log.append(f"    🔧 {label_cell} row {nr}: +${adj_amt:.2f}")
-                                        nr += 1
-                                        continue
-                                
-                                break
-                            
-                            if total_adjustments > 0:
-                                debug_log.append(f"    🎯 Adjustments: ${total_adjustments:.2f}")
-                            
-                            final_amt = total_amt + total_adjustments
-                            debug_log.append(f"    ✅ FINAL: ${final_amt:.2f}")
-                            
-                            return final_amt
-                
-                # Fallback search — with split-cell consolidation
-                for r in range(nrows):
-                    for c in fallback_window:
-                        if c >= ncols:
-                            continue
-
-                        v = sheet.cell_value(r, c)
-                        found_date = None
-                        try:
-                            if sheet.cell_type(r, c) == xlrd.XL_CELL_DATE:
-                                dt_tuple = xlrd.xldate_as_tuple(v, book.datemode)
-                                found_date = date(dt_tuple[0], dt_tuple[1], dt_tuple[2])
-                            else:
-                                found_date = _normalize_input_date_to_dateobj(str(v))
-                        except Exception:
-                            pass
-
-                        if found_date and found_date == target_date:
-                            amt_col = c + 1
-                            total_amt = safe_float(sheet.cell_value(r, amt_col)) if amt_col < ncols else 0.0
-                            # Consolidate split cells (same logic as primary path)
-                            check_r = r + 1
-                            while check_r < nrows:
-                                next_date_cell = sheet.cell_value(check_r, c)
-                                if _is_date_cell_empty(next_date_cell):
-                                    next_amt = safe_float(sheet.cell_value(check_r, amt_col)) if amt_col < ncols else 0.0
-                                    if next_amt > 0:
-                                        total_amt += next_amt
-                                    check_r += 1
-                                    continue
-                                break
-                            return total_amt
-            
-            return 0.0
-        
+                amt = _find_amount_in_view(
+                    XlrdSheetView(sheet, book.datemode), target_date, debug_log,
+                    preferred_date_cols, fallback_cols=fallback_window, detailed=True,
+                )
+                if amt is not None:
+                    return amt
         else:
-            dfs = pd.read_excel(path, sheet_name=None, engine=None)
-            
-            for sname, df in dfs.items():
+            for df in wb_cache.frames(path).values():
                 if df is None:
                     continue
-                
-                nrows, ncols = df.shape
-                
-                for r in range(nrows):
-                    for c in preferred_date_cols:
-                        if c >= ncols:
-                            continue
-                        
-                        try:
-                            v = df.iat[r, c]
-                        except Exception:
-                            v = None
-                        
-                        if v is None or (isinstance(v, float) and pd.isna(v)):
-                            continue
-                        
-                        found_date = None
-                        if isinstance(v, (datetime, date)):
-                            found_date = date(v.year, v.month, v.day)
-                        else:
-                            found_date = _normalize_input_date_to_dateobj(str(v))
-                        
-                        if found_date and found_date == target_date:
-                            col_letter = get_column_letter(c + 1)
-                            debug_log.append(f"    ✅ Found at column {col_letter}, row {r}")
-                            
-                            amt_col = c + 1
-                            base_amt = 0.0
-                            
-                            if amt_col < ncols:
-                                try:
-                                    base_amt = safe_float(df.iat[r, amt_col])
-                                except Exception:
-                                    pass
-                            
-                            total_amt = base_amt
-                            check_row = r + 1
-                            consolidated_count = 1
-                            consolidated_rows = [r]
-                            
-                            while check_row < nrows:
-                                try:
-                                    next_date_cell = df.iat[check_row, c]
-                                except Exception:
-                                    break
-                                
-                                if _is_date_cell_empty(next_date_cell):
-                                    try:
-                                        next_amt = safe_float(df.iat[check_row, amt_col])
-                                        if next_amt > 0:
-                                            total_amt += next_amt
-                                            consolidated_count += 1
-                                            consolidated_rows.append(check_row)
-                                            debug_log.append(f"    📍 Row {check_row} (SPLIT CELL - empty date): +${next_amt:.2f}")
-                                            check_row += 1
-                                            continue
-                                        else:
-                                            check_row += 1
-                                            continue
-                                    except Exception:
-                                        break
-
-                                # Same-date consolidation (repeated rows with identical date)
-                                next_date = None
-                                try:
-                                    if isinstance(next_date_cell, (datetime, date)):
-                                        next_date = date(next_date_cell.year, next_date_cell.month, next_date_cell.day)
-                                    else:
-                                        next_date = _normalize_input_date_to_dateobj(str(next_date_cell))
-                                except Exception:
-                                    pass
-
-                                if next_date and next_date == target_date:
-                                    try:
-                                        next_amt = safe_float(df.iat[check_row, amt_col])
-                                        total_amt += next_amt
-                                        consolidated_count += 1
-                                        consolidated_rows.append(check_row)
-                                        debug_log.append(f"    📍 Row {check_row} (SAME DATE): +${next_amt:.2f}")
-                                        check_row += 1
-                                        continue
-                                    except Exception:
-                                        break
-
-                                break
-                            
-                            debug_log.append(f"    🔗 Consolidated {consolidated_count} rows: {consolidated_rows}")
-                            debug_log.append(f"    💰 Total: ${total_amt:.2f}")
-                            
-                            return total_amt
-            
-            return 0.0
+                amt = _find_amount_in_view(PandasSheetView(df), target_date, debug_log, preferred_date_cols)
+                if amt is not None:
+                    return amt
+        
+        return 0.0
     
     except Exception as e:
-        debug_log.append(f"    ❌ ERROR: {e}")
+        if debug_log is not None:
+            debug_log.append(f"    ❌ ERROR: {e}")
         return 0.0
 
 
@@ -1124,6 +1087,85 @@ def cell_value_is_formula(cell_value: Any) -> bool:
 # SECTION 6: MAIN CLASS - v7.0.2 HYBRID (xlwings structure + v7.5.0 logic + xlwings writes)
 # ==============================================================================
 
+def compute_paysheet(
+    path: str,
+    month_index: int,
+    year: int,
+    date_multiplier_pairs: List[Tuple[str, float]],
+    enable_carryforward: bool,
+    target_dates: Optional[List[Optional[date]]] = None,
+) -> Dict[str, Any]:
+    """Compute everything AccrualUpdater.process() needs from one paysheet.
+
+    target_dates, if given, holds the already-parsed date of each pair (None
+    where it didn't parse) so a run parses its AB dates once, not per file.
+
+    Kept at module level so it can run in a worker process. Log lines are
+    returned rather than printed; on failure, 'error' holds the message and
+    'lines' what was logged before it.
+    """
+    lines: List[str] = []
+    res: Dict[str, Any] = {"lines": lines, "error": None}
+    try:
+        # parse_paysheet's debug lines were never shown; don't build them
+        hours, payments, _, _ = parse_paysheet(path, month_index, year, None)
+
+        admin_hours, admin_rate, admin_fee = calculate_admin_fee_for_paysheet(
+            path, month_index, year, debug=False, on_error=_report_admin_fee_failure
+        )
+
+        # Carryforward only runs in January (month_index == 1) OR if checkbox enabled
+        if enable_carryforward:
+            carryforward = calculate_carryforward_for_paysheet(path, year)
+            if carryforward > 0:
+                lines.append(f"  💼 {year - 1} Balance Forward: ${carryforward:.2f}")
+        else:
+            carryforward = 0.0
+
+        ab_total = 0.0
+        if date_multiplier_pairs:
+            lines.append(f"  Calculating AB from {len(date_multiplier_pairs)} date(s):")
+            if target_dates is None:
+                target_dates = [_normalize_input_date_to_dateobj(ds) for ds, _ in date_multiplier_pairs]
+            for (date_str, multiplier), target_date_obj in zip(date_multiplier_pairs, target_dates):
+                if not target_date_obj:
+                    lines.append(f"    ✗ Could not parse: {date_str}")
+                    continue
+
+                combined_amt = find_amount_for_date_in_paysheet(path, target_date_obj, lines)
+
+                computed = round(combined_amt * multiplier, 2)
+                ab_total += computed
+
+                lines.append(f"    💵 {date_str}: ${combined_amt:.2f} × {multiplier} = ${computed:.2f}")
+
+            lines.append(f"  🎯 AB Total: ${ab_total:.2f}")
+
+        res.update(hours=hours, payments=payments, admin_fee=admin_fee,
+                   carryforward=carryforward, ab_total=ab_total)
+    except Exception as e:
+        res["error"] = str(e)
+    return res
+
+
+def paysheet_file_number(path: str) -> Optional[str]:
+    """5-6 digit employee file number from a paysheet's file name, or None"""
+    m = _FILE_NUM_RE.search(os.path.basename(path))
+    return m.group(1) if m else None
+
+
+def paysheet_totals(path: str, month_index: int, year: int) -> Optional[Tuple[float, float]]:
+    """(hours, payments) for one paysheet month, or None if it can't be parsed.
+
+    Module level so the prior-month check can map it over a process pool.
+    """
+    try:
+        hours, payments, _, _ = parse_paysheet(path, month_index, year, None)
+    except Exception:
+        return None
+    return hours, payments
+
+
 class AccrualUpdater:
     """Main Accrual Updater v7.0.2 - Hybrid version (xlwings direct writes)"""
     
@@ -1140,6 +1182,8 @@ class AccrualUpdater:
         backup: bool = False,
         enable_ot_detection: bool = True,
         enable_carryforward: bool = False,
+        workers: int = 1,  # >1 → process pool for paysheets; 0 → one per CPU
+        log_path: Optional[str] = None,  # stream log lines here instead of log_lines
         **kwargs,
     ):
         self.master_path = master_path
@@ -1147,7 +1191,7 @@ class AccrualUpdater:
         self.header_row = header_row
         self.month = month
         try:
-            self.month_index = MONTHS.index(month) + 1
+            self.month_index = MONTH_INDEX[month]
         except Exception:
             self.month_index = 1
         self.year = year if year else datetime.now().year
@@ -1158,6 +1202,9 @@ class AccrualUpdater:
         self.enable_ot_detection = enable_ot_detection
         # Carryforward only runs in January by default; checkbox forces it on for any month
         self.enable_carryforward = enable_carryforward or (self.month_index == 1)
+        self.workers = workers if workers and workers > 0 else 0
+        self.log_path = log_path
+        self._log_file = None
         self.log_lines: List[str] = []
         self.debug_log: List[str] = []
         self.updated_count = 0
@@ -1169,12 +1216,18 @@ class AccrualUpdater:
 
     def log(self, line: str):
         print(line)
-        self.log_lines.append(line)
+        if self._log_file is not None:
+            self._log_file.write(line + "\n")
+        else:
+            self.log_lines.append(line)
 
-    def build_master_lookup(self, ws: Worksheet) -> Dict[str, Dict[str, Any]]:
-        """Build lookup dictionary from master file"""
+    def build_master_lookup(
+        self, ws: Worksheet, headers: Optional[Dict[str, Optional[int]]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Build lookup dictionary from master file (headers: find_headers() result, if already known)"""
         lookup: Dict[str, Dict[str, Any]] = {}
-        headers = find_headers(ws, self.header_row, self.month)
+        if headers is None:
+            headers = find_headers(ws, self.header_row, self.month)
         file_col = headers.get('file_col')
         name_col = headers.get('payroll_name_col')
         
@@ -1185,21 +1238,28 @@ class AccrualUpdater:
                 self.log(f"  Column {get_column_letter(col_num)}: {col_name}")
             return {}
         
-        for r in range(self.header_row + 1, ws.max_row + 1):
-            try:
-                v = ws.cell(row=r, column=file_col).value if file_col else None
-            except Exception:
-                v = None
+        # One sweep over just the file/name column span
+        lo = min(file_col, name_col) if name_col else file_col
+        hi = max(file_col, name_col) if name_col else file_col
+        first_row = self.header_row + 1
+        rows = ws.iter_rows(min_row=first_row, max_row=ws.max_row,
+                            min_col=lo, max_col=hi, values_only=True)
+        for r, row_vals in enumerate(rows, first_row):
+            v = row_vals[file_col - lo] if file_col - lo < len(row_vals) else None
             
             fnum = None
             if v is not None:
-                m = re.search(r'(\d{5,6})', str(v))
+                m = _FILE_NUM_RE.search(str(v))
                 if m:
                     fnum = m.group(1)
             
             if fnum:
-                name_val = ws.cell(row=r, column=name_col).value if name_col else None
-                lookup[fnum] = {"row": r, "name": name_val}
+                name_val = None
+                if name_col and name_col - lo < len(row_vals):
+                    name_val = row_vals[name_col - lo]
+                # "(hourly)" name suffix, checked once here rather than per paysheet
+                hourly = 'hourly' in str(name_val or "").lower()
+                lookup[fnum] = {"row": r, "name": name_val, "hourly": hourly}
         
         return lookup
 
@@ -1211,6 +1271,8 @@ class AccrualUpdater:
         file_col: int,
         files: List[str],
         master_lookup: Dict[str, Dict[str, Any]],
+        file_nums: Optional[Dict[str, Optional[str]]] = None,
+        executor: Optional[ProcessPoolExecutor] = None,
     ) -> None:
         """Cross-check other months' hours/billed data already in the master.
 
@@ -1219,13 +1281,14 @@ class AccrualUpdater:
         inside the header text, then cross-checks against paysheets.
 
         Never hardcodes column positions or month names — everything comes
-        from reading the actual master headers.
+        from reading the actual master headers. Paysheets are re-parsed on
+        executor when one is given (the caller's paysheet pool), otherwise in
+        this process.
         """
         # Build a month lookup from actual header text.
         # For each header cell, check if it contains a recognisable month AND
         # a data-type keyword (hours/hrs/billed/billing).
         all_month_names = list(MONTHS)           # ["January", ..., "December"]
-        all_month_abbrs = list(MONTH_ABBREVIATIONS.values())  # ["Jan", ..., "Dec"]
 
         # {month_index: {"name": ..., "hrs_col": col|None, "bill_col": col|None}}
         detected: Dict[int, dict] = {}
@@ -1235,9 +1298,8 @@ class AccrualUpdater:
 
             # Which month does this header belong to? Use word-boundary regex.
             matched_months: List[Tuple[int, str]] = []
-            for i, (full, abbr) in enumerate(zip(all_month_names, all_month_abbrs)):
-                if (re.search(rf'\b{re.escape(full.lower())}\b', t) or
-                        re.search(rf'\b{re.escape(abbr.lower())}\b', t)):
+            for i, (full, (full_re, abbr_re)) in enumerate(zip(all_month_names, _MONTH_WORD_LOWER_RES)):
+                if full_re.search(t) or abbr_re.search(t):
                     matched_months.append((i + 1, full))
 
             # If header mentions multiple months (e.g. "May/June Adjust"), skip it
@@ -1284,20 +1346,39 @@ class AccrualUpdater:
         )
         self.log(f"🔎 Pre-validation: cross-checking {labels}")
 
-        # Open master read-only to get cell values
-        wb_check = openpyxl.load_workbook(ws_read_path, read_only=True, data_only=True)
+        # Open master read-only and pull the other months' cells in one sweep
+        # (ws.cell() re-parses the sheet on every call in read-only mode)
+        wb_check = openpyxl.load_workbook(ws_read_path, read_only=True, data_only=True, keep_links=False)
         ws_check = wb_check[self.sheet_name]
+        check_cols = sorted({c for mc in other_months for c in (mc['hrs_col'], mc['bill_col']) if c})
+        check_rows = {rec['row'] for rec in master_lookup.values()}
+        master_vals: Dict[Tuple[int, int], Any] = {}
+        if check_cols and check_rows:
+            min_col = check_cols[0]
+            for r, row_vals in enumerate(ws_check.iter_rows(min_row=min(check_rows), max_row=max(check_rows),
+                                                            min_col=min_col, max_col=check_cols[-1],
+                                                            values_only=True), min(check_rows)):
+                if r in check_rows:
+                    for c in check_cols:
+                        if c - min_col < len(row_vals):
+                            master_vals[(r, c)] = row_vals[c - min_col]
+        wb_check.close()
 
         # Build paysheet file-number lookup
+        if file_nums is None:
+            file_nums = {fp: paysheet_file_number(fp) for fp in files}
         ps_lookup: Dict[str, str] = {}
         for fp in files:
-            m = re.search(r'(\d{5,6})', os.path.basename(fp))
-            if m:
-                ps_lookup[m.group(1)] = fp
+            fnum = file_nums[fp]
+            if fnum:
+                ps_lookup[fnum] = fp
 
         warnings_found = 0
         employees_checked = 0
 
+        # First collect the (employee, month) pairs the master has data for,
+        # then re-parse those paysheets (in worker processes when enabled)
+        checks = []
         for fnum, ps_path in ps_lookup.items():
             if fnum not in master_lookup:
                 continue
@@ -1309,13 +1390,13 @@ class AccrualUpdater:
                 master_hrs = 0.0
                 master_bill = 0.0
                 if mc['hrs_col']:
-                    v = ws_check.cell(row=row, column=mc['hrs_col']).value
+                    v = master_vals.get((row, mc['hrs_col']))
                     try:
                         master_hrs = float(v) if v else 0.0
                     except (ValueError, TypeError):
                         master_hrs = 0.0
                 if mc['bill_col']:
-                    v = ws_check.cell(row=row, column=mc['bill_col']).value
+                    v = master_vals.get((row, mc['bill_col']))
                     try:
                         master_bill = float(v) if v else 0.0
                     except (ValueError, TypeError):
@@ -1325,38 +1406,43 @@ class AccrualUpdater:
                 if master_hrs == 0.0 and master_bill == 0.0:
                     continue
 
-                # Re-parse paysheet for this other month
-                try:
-                    dbg: List[str] = []
-                    ps_hrs, ps_bill, _, _ = parse_paysheet(
-                        ps_path, mc['idx'], self.year, dbg
-                    )
-                except Exception:
-                    continue
+                checks.append((ps_path, mc, row, name, master_hrs, master_bill))
 
-                employees_checked += 1
+        # Re-parse paysheets for the other months; map keeps results in check order
+        paths = [c[0] for c in checks]
+        month_idxs = [c[1]['idx'] for c in checks]
+        years = [self.year] * len(checks)
+        if executor is not None and len(checks) > 1:
+            totals = list(executor.map(paysheet_totals, paths, month_idxs, years))
+        else:
+            totals = list(map(paysheet_totals, paths, month_idxs, years))
 
-                hrs_diff = abs(master_hrs - ps_hrs)
-                bill_diff = abs(master_bill - ps_bill)
+        for (ps_path, mc, row, name, master_hrs, master_bill), ps_totals in zip(checks, totals):
+            if ps_totals is None:
+                continue
+            ps_hrs, ps_bill = ps_totals
 
-                issues = []
-                if hrs_diff > 0.5:
-                    issues.append(
-                        f"Hours: master={master_hrs:.1f} vs paysheet={ps_hrs:.1f} (diff={hrs_diff:.1f})"
-                    )
-                if bill_diff > 1.0:
-                    issues.append(
-                        f"Billed: master=${master_bill:.2f} vs paysheet=${ps_bill:.2f} (diff=${bill_diff:.2f})"
-                    )
+            employees_checked += 1
 
-                if issues:
-                    warnings_found += 1
-                    self.log(
-                        f"  ⚠️  {mc['name']} MISMATCH — Row {row} ({name}): "
-                        + " | ".join(issues)
-                    )
+            hrs_diff = abs(master_hrs - ps_hrs)
+            bill_diff = abs(master_bill - ps_bill)
 
-        wb_check.close()
+            issues = []
+            if hrs_diff > 0.5:
+                issues.append(
+                    f"Hours: master={master_hrs:.1f} vs paysheet={ps_hrs:.1f} (diff={hrs_diff:.1f})"
+                )
+            if bill_diff > 1.0:
+                issues.append(
+                    f"Billed: master=${master_bill:.2f} vs paysheet=${ps_bill:.2f} (diff=${bill_diff:.2f})"
+                )
+
+            if issues:
+                warnings_found += 1
+                self.log(
+                    f"  ⚠️  {mc['name']} MISMATCH — Row {row} ({name}): "
+                    + " | ".join(issues)
+                )
 
         if warnings_found == 0:
             self.log(f"  ✅ All prior month data matches ({employees_checked} checks)\n")
@@ -1367,7 +1453,21 @@ class AccrualUpdater:
             )
 
     def process(self):
-        """Process - MAIN LOOP (xlwings structure + v7.5.0 logic + xlwings writes)"""
+        """Process - MAIN LOOP (xlwings structure + v7.5.0 logic + xlwings writes)
+
+        With log_path set, the log is written to that file as it goes and
+        log_lines stays empty.
+        """
+        if not self.log_path:
+            return self._process()
+        with open(self.log_path, "w", encoding="utf-8") as fh:
+            self._log_file = fh
+            try:
+                return self._process()
+            finally:
+                self._log_file = None
+
+    def _process(self):
         self.start_time = time.time()
         
         self.log("\n" + "="*80)
@@ -1388,8 +1488,10 @@ class AccrualUpdater:
         self.log(f"Master: {self.master_path}")
         self.log(f"Paysheets: {self.paysheets_folder}\n")
 
-        # Load with openpyxl (READ ONLY - just for headers)
-        wb_read = openpyxl.load_workbook(filename=self.master_path, read_only=True, data_only=False)
+        # Load with openpyxl (READ ONLY - headers + lookup; external link parts skipped)
+        wb_read = openpyxl.load_workbook(
+            filename=self.master_path, read_only=True, data_only=False, keep_links=False
+        )
         
         if self.sheet_name not in wb_read.sheetnames:
             self.log(f"❌ Sheet '{self.sheet_name}' not found!")
@@ -1451,146 +1553,151 @@ class AccrualUpdater:
         self.log(f"✅ Writing to columns: {sorted([get_column_letter(c) for c in self.ALLOWED_COLS])}")
         self.log(f"🚫 Protected columns (untouched): All others\n")
 
-        master_lookup = self.build_master_lookup(ws_read)
+        master_lookup = self.build_master_lookup(ws_read, headers)
         wb_read.close()
 
         if not master_lookup:
             self.log("❌ ERROR: Could not build master lookup")
             raise RuntimeError("Could not build master lookup")
 
-        valid_exts = {'.xls', '.xlsx', '.xlsm'}
-        files: List[str] = []
-        for root, _, fnames in os.walk(self.paysheets_folder):
-            for fn in fnames:
-                if os.path.splitext(fn)[1].lower() in valid_exts:
-                    files.append(os.path.join(root, fn))
+        files: List[str] = list(iter_paysheet_files(self.paysheets_folder))
+        # File number from each file name, extracted once for every pass below
+        file_nums = {fp: paysheet_file_number(fp) for fp in files}
 
         self.log(f"Found {len(files)} paysheet(s)\n")
 
-        # ── Pre-validation: cross-check prior months' data ──────────────
-        self._validate_prior_months(
-            ws_read_path=self.master_path,
-            header_row=self.header_row,
-            all_headers=all_headers,
-            file_col=file_col,
-            files=files,
-            master_lookup=master_lookup,
-        )
+        updates_to_apply = []
 
-        if not salary_paid_col:
-            self.log("  🚨 WARNING: 'Salary Paid' column NOT FOUND — AB/multiplier values will NOT be written!")
+        # AB dates are the same for every paysheet: parse them once
+        target_dates = [_normalize_input_date_to_dateobj(ds) for ds, _ in self.date_multiplier_pairs]
 
-        updates_to_apply = []
+        # Optional worker pool: paysheets are independent, so they can be
+        # computed up front while this loop consumes results in file order.
+        # The prior-month check below reuses the same workers.
+        executor = None
+        pending: Dict[str, Any] = {}
+        try:
+            todo: List[str] = []
+            if self.workers != 1 and len(files) > 1:
+                todo = [fp for fp in files if file_nums[fp] in master_lookup]
+                if len(todo) > 1:
+                    n_workers = min(self.workers or os.cpu_count() or 1, len(todo))
+                    executor = ProcessPoolExecutor(max_workers=n_workers)
+
+            # ── Pre-validation: cross-check prior months' data ──────────────
+            self._validate_prior_months(
+                ws_read_path=self.master_path,
+                header_row=self.header_row,
+                all_headers=all_headers,
+                file_col=file_col,
+                files=files,
+                master_lookup=master_lookup,
+                file_nums=file_nums,
+                executor=executor,
+            )
+
+            if not salary_paid_col:
+                self.log("  🚨 WARNING: 'Salary Paid' column NOT FOUND — AB/multiplier values will NOT be written!")
+
+            if executor is not None:
+                for fp in todo:
+                    pending[fp] = executor.submit(
+                        compute_paysheet, fp, self.month_index, self.year,
+                        self.date_multiplier_pairs, self.enable_carryforward, target_dates,
+                    )
+                self.log(f"⚙️  Computing {len(todo)} paysheet(s) in {n_workers} worker process(es)\n")
 
-        for idx, fp in enumerate(files, 1):
-            fname = os.path.basename(fp)
-            self.log(f"[{idx}/{len(files)}] {fname}")
+            for idx, fp in enumerate(files, 1):
+                fname = os.path.basename(fp)
+                self.log(f"[{idx}/{len(files)}] {fname}")
             
-            fnum = None
-            m = re.search(r'(\d{5,6})', fname)
-            if m:
-                fnum = m.group(1)
+                fnum = file_nums[fp]
             
-            if not fnum:
-                self.no_match_count += 1
-                self.log("  ✗ NO FILE NUMBER")
-                continue
+                if not fnum:
+                    self.no_match_count += 1
+                    self.log("  ✗ NO FILE NUMBER")
+                    continue
             
-            if fnum not in master_lookup:
-                self.no_match_count += 1
-                self.log("  ✗ NOT IN MASTER")
-                continue
+                if fnum not in master_lookup:
+                    self.no_match_count += 1
+                    self.log("  ✗ NOT IN MASTER")
+                    continue
             
-            rec = master_lookup[fnum]
-            row = rec["row"]
-            name_val = rec.get("name") or ""
-            self.log(f"  ✓ {name_val} (Row {row})")
-
-            try:
-                dbg: List[str] = []
-                hours, payments, _, _ = parse_paysheet(fp, self.month_index, self.year, dbg)
-
-                admin_hours, admin_rate, admin_fee = calculate_admin_fee_for_paysheet(
-                    fp, self.month_index, self.year, debug=False
-                )
-
-                # Carryforward only runs in January (month_index == 1) OR if checkbox enabled
-                if self.enable_carryforward:
-                    carryforward = calculate_carryforward_for_paysheet(fp, self.year)
-                    if carryforward > 0:
-                        self.log(f"  💼 {self.year - 1} Balance Forward: ${carryforward:.2f}")
-                else:
-                    carryforward = 0.0
-
-                ab_total = 0.0
-                if self.date_multiplier_pairs:
-                    self.log(f"  Calculating AB from {len(self.date_multiplier_pairs)} date(s):")
-                    for date_str, multiplier in self.date_multiplier_pairs:
-                        target_date_obj = _normalize_input_date_to_dateobj(date_str)
-                        if not target_date_obj:
-                            self.log(f"    ✗ Could not parse: {date_str}")
-                            continue
-                        
-                        dbg_before = len(dbg)
-                        combined_amt = find_amount_for_date_in_paysheet(fp, target_date_obj, dbg)
-                        
-                        for d in dbg[dbg_before:]:
-                            self.log(d)
-                        
-                        computed = round(combined_amt * multiplier, 2)
-                        ab_total += computed
-                        
-                        self.log(f"    💵 {date_str}: ${combined_amt:.2f} × {multiplier} = ${computed:.2f}")
-                    
-                    self.log(f"  🎯 AB Total: ${ab_total:.2f}")
-
-                # For hourly employees: Wages Earned = Billed to Client
-                # Detect hourly: folder path takes precedence (most reliable),
-                # then fall back to name suffix "(hourly)"
-                fp_lower = fp.lower()
-                is_hourly = (
-                    'hourly sheets' in fp_lower
-                    or 'hourly sheet' in fp_lower
-                    or '/hourly/' in fp_lower
-                    or 'hourly' in str(name_val).lower()
-                )
-                wages_earned_val = None
-                if is_hourly and wages_earned_col and payments > 0:
-                    wages_earned_val = round(payments, 2)
-
-                if not self.dry_run:
-                    update_record = {
-                        'row': row,
-                        'accrual_col': accrual_col,
-                        'accrual_val': round(hours, 4),
-                        'billed_col': billed_col,
-                        'billed_val': round(payments, 2),
-                        'admin_fee_col': admin_fee_col,
-                        'admin_fee_val': round(admin_fee, 2) if admin_fee > 0 else None,
-                        'salary_paid_col': salary_paid_col,
-                        'salary_paid_val': round(ab_total, 2) if ab_total > 0 else None,
-                        'carryforward_col': carryforward_col,
-                        'carryforward_val': round(carryforward, 2) if carryforward > 0 else None,
-                        'wages_earned_col': wages_earned_col if is_hourly else None,
-                        'wages_earned_val': wages_earned_val,
-                    }
-                    updates_to_apply.append(update_record)
-
-                    we_str = f" | WE=${payments:.0f}" if wages_earned_val else ""
-                    self.log(f"  ✓ Queued: H={hours:.0f} | B=${payments:.0f} | A=${admin_fee:.0f} | SP=${ab_total:.0f} | CF=${carryforward:.0f}{we_str}")
-                else:
-                    we_str = f" | WE=${payments:.0f}" if wages_earned_val else ""
-                    self.log(f"  (dry) H={hours:.0f} | B=${payments:.0f} | A=${admin_fee:.0f} | SP=${ab_total:.0f} | CF=${carryforward:.0f}{we_str}")
-
-                has_data = hours > 0 or payments > 0 or admin_fee > 0 or ab_total > 0 or carryforward > 0
-                if has_data:
-                    self.updated_count += 1
-                else:
-                    self.log(f"  ⚠️  All values zero — not counted as updated")
+                rec = master_lookup[fnum]
+                row = rec["row"]
+                name_val = rec.get("name") or ""
+                self.log(f"  ✓ {name_val} (Row {row})")
 
-            except Exception as e:
-                self.failed_count += 1
-                self.log(f"  ✗ ERROR: {e}")
+                try:
+                    if fp in pending:
+                        res = pending.pop(fp).result()
+                    else:
+                        res = compute_paysheet(fp, self.month_index, self.year,
+                                               self.date_multiplier_pairs, self.enable_carryforward,
+                                               target_dates)
+                    for line in res["lines"]:
+                        self.log(line)
+                    if res["error"] is not None:
+                        raise RuntimeError(res["error"])
+
+                    hours = res["hours"]
+                    payments = res["payments"]
+                    admin_fee = res["admin_fee"]
+                    carryforward = res["carryforward"]
+                    ab_total = res["ab_total"]
+
+                    # For hourly employees: Wages Earned = Billed to Client
+                    # Detect hourly: folder path takes precedence (most reliable),
+                    # then fall back to name suffix "(hourly)" flagged by the lookup.
+                    # Only matters when there is a Wages Earned column to write.
+                    fp_lower = fp.lower()
+                    is_hourly = bool(wages_earned_col) and (
+                        'hourly sheet' in fp_lower          # also covers "hourly sheets"
+                        or '/hourly/' in fp_lower
+                        or rec.get("hourly", False)
+                    )
+                    wages_earned_val = None
+                    if is_hourly and wages_earned_col and payments > 0:
+                        wages_earned_val = round(payments, 2)
+
+                    if not self.dry_run:
+                        update_record = {
+                            'row': row,
+                            'accrual_col': accrual_col,
+                            'accrual_val': round(hours, 4),
+                            'billed_col': billed_col,
+                            'billed_val': round(payments, 2),
+                            'admin_fee_col': admin_fee_col,
+                            'admin_fee_val': round(admin_fee, 2) if admin_fee > 0 else None,
+                            'salary_paid_col': salary_paid_col,
+                            'salary_paid_val': round(ab_total, 2) if ab_total > 0 else None,
+                            'carryforward_col': carryforward_col,
+                            'carryforward_val': round(carryforward, 2) if carryforward > 0 else None,
+                            'wages_earned_col': wages_earned_col if is_hourly else None,
+                            'wages_earned_val': wages_earned_val,
+                        }
+                        updates_to_apply.append(update_record)
+
+                        we_str = f" | WE=${payments:.0f}" if wages_earned_val else ""
+                        self.log(f"  ✓ Queued: H={hours:.0f} | B=${payments:.0f} | A=${admin_fee:.0f} | SP=${ab_total:.0f} | CF=${carryforward:.0f}{we_str}")
+                    else:
+                        we_str = f" | WE=${payments:.0f}" if wages_earned_val else ""
+                        self.log(f"  (dry) H={hours:.0f} | B=${payments:.0f} | A=${admin_fee:.0f} | SP=${ab_total:.0f} | CF=${carryforward:.0f}{we_str}")
+
+                    has_data = hours > 0 or payments > 0 or admin_fee > 0 or ab_total > 0 or carryforward > 0
+                    if has_data:
+                        self.updated_count += 1
+                    else:
+                        self.log(f"  ⚠️  All values zero — not counted as updated")
+
+                except Exception as e:
+                    self.failed_count += 1
+                    self.log(f"  ✗ ERROR: {e}")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            # Paysheets are done; release cached workbooks and their file handles
+            wb_cache.clear()
 
         # NOW: Use xlwings to apply ALL updates to Excel
         if not self.dry_run and updates_to_apply:
@@ -1622,54 +1729,68 @@ class AccrualUpdater:
                 try:
                     ws_xw = book.sheets[self.sheet_name]
 
-                    def _xw_has_formula(r: int, c: int) -> bool:
-                        """Check if cell has formula via xlwings (no TOCTOU race)."""
-                        try:
-                            formula = ws_xw.cells(r, c).formula
-                            return isinstance(formula, str) and formula.startswith('=')
-                        except Exception:
-                            return False
-
-                    def _safe_write(r: int, c: int, val, label: str = "") -> bool:
-                        """Write value to cell if it's not a formula. Returns True if written."""
-                        if _xw_has_formula(r, c):
-                            self.log(f"  ⚠️  {get_column_letter(c)}{r} has formula - SKIPPED")
-                            return False
-                        ws_xw.cells(r, c).value = val
-                        suffix = f" ({label})" if label else ""
-                        self.log(f"  ✓ {get_column_letter(c)}{r} = {val}{suffix}")
-                        return True
-
-                    updates_written = 0
+                    # Collect every write first: (row, col, value, label) in log order
+                    pending_writes: List[Tuple[int, int, Any, str]] = []
                     for update in updates_to_apply:
                         row = update['row']
 
                         if accrual_col in self.ALLOWED_COLS:
-                            if _safe_write(row, accrual_col, update['accrual_val']):
-                                updates_written += 1
+                            pending_writes.append((row, accrual_col, update['accrual_val'], ""))
 
                         if billed_col in self.ALLOWED_COLS:
-                            if _safe_write(row, billed_col, update['billed_val']):
-                                updates_written += 1
+                            pending_writes.append((row, billed_col, update['billed_val'], ""))
 
                         if admin_fee_col and admin_fee_col in self.ALLOWED_COLS and update['admin_fee_val'] is not None:
-                            if _safe_write(row, admin_fee_col, update['admin_fee_val']):
-                                updates_written += 1
+                            pending_writes.append((row, admin_fee_col, update['admin_fee_val'], ""))
 
                         sp_col = update.get('salary_paid_col')
                         if sp_col and sp_col in self.ALLOWED_COLS and update.get('salary_paid_val') is not None:
-                            if _safe_write(row, sp_col, update['salary_paid_val'], "Salary Paid"):
-                                updates_written += 1
+                            pending_writes.append((row, sp_col, update['salary_paid_val'], "Salary Paid"))
 
                         we_col = update.get('wages_earned_col')
                         if we_col and we_col in self.ALLOWED_COLS and update.get('wages_earned_val') is not None:
-                            if _safe_write(row, we_col, update['wages_earned_val'], "Wages Earned - hourly"):
-                                updates_written += 1
+                            pending_writes.append((row, we_col, update['wages_earned_val'], "Wages Earned - hourly"))
 
                         cf_col = update.get('carryforward_col')
                         if cf_col and cf_col in self.ALLOWED_COLS and update.get('carryforward_val') is not None:
-                            if _safe_write(row, cf_col, update['carryforward_val'], "Balance Forward"):
-                                updates_written += 1
+                            pending_writes.append((row, cf_col, update['carryforward_val'], "Balance Forward"))
+
+                    def _xw_has_formula(r: int, c: int) -> bool:
+                        """Check if cell has formula via xlwings (no TOCTOU race)."""
+                        try:
+                            formula = ws_xw.cells(r, c).formula
+                            return isinstance(formula, str) and formula.startswith('=')
+                        except Exception:
+                            return False
+
+                    # Read formulas one column span at a time instead of one COM call
+                    # per cell. We only ever write numbers, so no write below can turn
+                    # a cell into a formula and the up-front read stays valid.
+                    formula_cells: set = set()
+                    rows_by_col: Dict[int, List[int]] = {}
+                    for r, c, _, _ in pending_writes:
+                        rows_by_col.setdefault(c, []).append(r)
+                    for c, rows in rows_by_col.items():
+                        r1, r2 = min(rows), max(rows)
+                        try:
+                            formulas = ws_xw.range((r1, c), (r2, c)).formula
+                            if r1 == r2:
+                                formulas = ((formulas,),)
+                            for offset, (formula,) in enumerate(formulas):
+                                if isinstance(formula, str) and formula.startswith('='):
+                                    formula_cells.add((r1 + offset, c))
+                        except Exception:
+                            formula_cells.update((r, c) for r in set(rows) if _xw_has_formula(r, c))
+
+                    updates_written = 0
+                    for r, c, val, label in pending_writes:
+                        if (r, c) in formula_cells:
+                            self.log(f"  ⚠️  {get_column_letter(c)}{r} has formula - SKIPPED")
+                            continue
+                        ws_xw.cells(r, c).value = val
+                        suffix = f" ({label})" if label else ""
+                        self.log(f"  ✓ {get_column_letter(c)}{r} = {val}{suffix}")
+                        updates_written += 1
                     
                     # CRITICAL: Save through Excel (preserves all connections, pivot tables!)
                     book.save()
@@ -1738,6 +1859,9 @@ def run_cli():
     parser.add_argument("--multipliers", nargs="+", type=float, help="Multipliers for dates")
     parser.add_argument("--dry-run", action="store_true", help="Preview changes without writing")
     parser.add_argument("--backup", action="store_true", help="Create backup before writing")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for paysheet parsing (0 = one per CPU, default 1)")
+    parser.add_argument("--log-file", help="Write the run log to this file (UTF-8)")
     parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
     
     args = parser.parse_args()
@@ -1760,6 +1884,8 @@ def run_cli():
         date_multiplier_pairs=date_multiplier_pairs,
         dry_run=args.dry_run,
         backup=args.backup,
+        workers=args.workers,
+        log_path=args.log_file,
     )
     
     result = updater.process()
@@ -1767,4 +1893,5 @@ def run_cli():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     run_cli()
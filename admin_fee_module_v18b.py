@@ -1,14 +1,23 @@
 #!/usr/bin/env python3
-import os, re, sys, argparse
-from typing import Any, Optional, Tuple, List
+import os, re, sys, argparse, bisect, functools
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple, List, NamedTuple
 
+# Optional readers: a missing one must not take down an importing GUI/server
 try:
     import xlrd
+    SUPPORT_XLS = True
 except ImportError:
-    print("ERROR: xlrd not available")
-    sys.exit(1)
+    SUPPORT_XLS = False
+
+try:
+    from python_calamine import CalamineWorkbook
+    SUPPORT_CALAMINE = True
+except ImportError:
+    SUPPORT_CALAMINE = False
 
 MONTHS = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
+MONTH_INDEX = {name: i for i, name in enumerate(MONTHS, 1)}  # "January" -> 1
 
 
 def year_in_sheet_name(year: int, name: str) -> bool:
@@ -16,19 +25,224 @@ def year_in_sheet_name(year: int, name: str) -> bool:
     return bool(re.search(rf'(?<!\d){year}(?!\d)', str(name)))
 
 
+PAYSHEET_EXTS = {'.xls', '.xlsx', '.xlsm'}
+
+
+def iter_paysheet_files(top: str, exts=PAYSHEET_EXTS):
+    """Yield paths under top whose extension (any case) is in exts, in os.walk order.
+
+    One scandir per directory; each DirEntry's cached type is reused and a
+    directory's files come before its subdirectories, like os.walk's
+    top-down listing. Unreadable directories are skipped, symlinked
+    directories are not followed. Shared by the updater, the GUI and the
+    web backend.
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            subdirs.append(entry.path)
+        elif os.path.splitext(entry.name)[1].lower() in exts:
+            yield entry.path
+    for path in subdirs:
+        if not os.path.islink(path):
+            yield from iter_paysheet_files(path, exts)
+
+
+_SECTION_HEADERS = ('work period', 'hours & payment')
+_STATIC_FEE_LABELS = ('admin fee', 'adminfee')
+
+
+def _text_label(text: str) -> Optional[str]:
+    """'header', 'eff' or 'static' for a stripped, lowercased label cell"""
+    if "admin fee eff" in text:
+        return 'eff'
+    if text in _STATIC_FEE_LABELS:
+        return 'static'
+    if text in _SECTION_HEADERS:
+        return 'header'
+    return None
+
+
+def _cell_label(val: Any) -> Optional[str]:
+    """_text_label of a raw cell value (None for empty cells)"""
+    if not val:
+        return None
+    return _text_label(str(val).strip().lower())
+
+
+class SheetSnapshot(NamedTuple):
+    """Cell values of one paysheet tab; answers the xlrd calls used below.
+
+    text_lc holds every cell as str(v).strip().lower() ("" for empty cells)
+    so the scans below normalize each cell once. labels maps each
+    _cell_label kind to its (row, col) cells in row-major order.
+    """
+    nrows: int
+    ncols: int
+    values: Tuple[Tuple[Any, ...], ...]
+    text_lc: Tuple[Tuple[str, ...], ...]
+    labels: Dict[str, List[Tuple[int, int]]]
+
+    def cell_value(self, r: int, c: int) -> Any:
+        return self.values[r][c]
+
+    def row_values(self, r: int) -> List[Any]:
+        return list(self.values[r])
+
+
+_OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"  # legacy .xls container, all xlrd reads
+_XL_EPOCH = datetime(1899, 12, 30)
+
+
+def _xlrd_value(v: Any) -> Any:
+    """A calamine cell as xlrd's cell_value would return it (floats for numbers,
+    0/1 for booleans, 1900-system serials for dates); error cells are already ''"""
+    t = type(v)
+    if t is float or t is str:
+        return v
+    if t is int:
+        return float(v)
+    if t is bool:
+        return int(v)
+    if t is datetime:
+        return (v - _XL_EPOCH) / timedelta(days=1)
+    if t is date:
+        return float((v - _XL_EPOCH.date()).days)
+    if t is time:
+        return (v.hour * 3600 + v.minute * 60 + v.second + v.microsecond / 1e6) / 86400
+    if t is timedelta:
+        return v / timedelta(days=1)
+    return v
+
+
+def _xlrd_row(sheet, r: int) -> Tuple[Any, ...]:
+    """sheet.row_values(r) with error cells (#N/A, #DIV/0! ...) blanked.
+
+    xlrd returns an error cell's code (42 for #N/A) and safe_float would
+    count it as a number; calamine reads error cells as '' and so does this.
+    """
+    values = sheet.row_values(r)
+    types = sheet.row_types(r)
+    if xlrd.XL_CELL_ERROR in types:
+        return tuple('' if t == xlrd.XL_CELL_ERROR else v for v, t in zip(values, types))
+    return tuple(values)
+
+
+def _is_ole2(path: str) -> bool:
+    with open(path, "rb") as fh:
+        return fh.read(8) == _OLE2_MAGIC
+
+
+def _read_year_rows(path: str, year: int) -> Optional[Tuple[Tuple[Any, ...], ...]]:
+    """Rows of the first year tab (None if there is none).
+
+    calamine parses the file in Rust and hands the tab back in one call;
+    xlrd is the fallback when it is missing or cannot read the file.
+    """
+    if SUPPORT_CALAMINE and _is_ole2(path):
+        try:
+            book = CalamineWorkbook.from_path(path)
+        except Exception:
+            pass
+        else:
+            for idx, name in enumerate(book.sheet_names):
+                if year_in_sheet_name(year, name):
+                    rows = book.get_sheet_by_index(idx).to_python(skip_empty_area=False)
+                    return tuple(tuple(map(_xlrd_value, row)) for row in rows)
+            return None
+    if not SUPPORT_XLS:
+        raise RuntimeError("xlrd required for xls parsing")
+    book = xlrd.open_workbook(path, formatting_info=False, on_demand=True)
+    try:
+        for idx, name in enumerate(book.sheet_names()):
+            if year_in_sheet_name(year, name):
+                sheet = book.sheet_by_index(idx)
+                return tuple(_xlrd_row(sheet, r) for r in range(sheet.nrows))
+        return None
+    finally:
+        book.release_resources()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_sheet(path: str, year: int, mtime_ns: int, size: int) -> Optional[SheetSnapshot]:
+    """Snapshot of the first year tab (None if there is none).
+
+    mtime/size are part of the key, so an edited paysheet is re-read.
+    """
+    values = _read_year_rows(path, year)
+    if values is None:
+        return None
+    text_lc = tuple(tuple(str(v).strip().lower() if v else "" for v in row) for row in values)
+    labels: Dict[str, List[Tuple[int, int]]] = {'header': [], 'eff': [], 'static': []}
+    for r, row in enumerate(text_lc):
+        for c, text in enumerate(row):
+            kind = _text_label(text) if text else None
+            if kind:
+                labels[kind].append((r, c))
+    return SheetSnapshot(len(values), len(values[0]) if values else 0, values, text_lc, labels)
+
+
+def load_year_sheet(paysheet_path: str, year: int) -> Optional[SheetSnapshot]:
+    """Cached snapshot of a paysheet's year tab, re-read when the file changes"""
+    st = os.stat(paysheet_path)
+    return _load_sheet(os.path.abspath(paysheet_path), year, st.st_mtime_ns, st.st_size)
+
+
+def _label_cells(sheet, kind: str, start: int, stop: int) -> List[Tuple[int, int]]:
+    """(row, col) of kind-labelled cells in rows [start, stop), row-major.
+
+    Snapshots answer from their label index; plain xlrd sheets are scanned.
+    """
+    labels = getattr(sheet, 'labels', None)
+    if labels is not None:
+        return [rc for rc in labels[kind] if start <= rc[0] < stop]
+    return [(r, c) for r in range(start, stop) for c in range(sheet.ncols)
+            if _cell_label(sheet.cell_value(r, c)) == kind]
+
+
+_SAFE_FLOAT_RE = re.compile(r"-?\d+(?:\.\d+)?")
+# Drop "," "$" ")" and turn "(" into "-" in one pass
+_SAFE_FLOAT_TRANS = str.maketrans({",": None, "$": None, "(": "-", ")": None})
+_PERIOD_RANGE_RE = re.compile(r'(\d{1,2})/(\d{1,2})\s*[-/]\s*(\d{1,2})[-/](\d{1,2})[-/](\d{4})')
+_SLASH_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{2,4})')
+# A section's period column ends at its first total/admin fees/deductions row
+# (plain substrings, no word boundaries: 'subtotal' ends a section too)
+_SECTION_END_RE = re.compile(r'total|admin fees|deductions')
+
 def safe_float(x: Any) -> float:
     try:
+        # Fast paths: xlrd hands numeric cells over as float
+        tx = type(x)
+        if tx is float: return x
+        if tx is int: return float(x)
         if x is None: return 0.0
         if isinstance(x, (int, float)): return float(x)
-        s = str(x).strip().replace(",", "").replace("$", "").replace("(", "-").replace(")", "")
+        s = str(x).strip()
+        if s and (s[0].isdigit() or (s[0] == "-" and s[1:2].isdigit())) \
+                and "e" not in s and "E" not in s and "_" not in s:
+            # Plain numeric text: float() agrees with the regex below
+            try:
+                return float(s)
+            except ValueError:
+                pass
+        s = s.translate(_SAFE_FLOAT_TRANS)
         if s in ("", "-"): return 0.0
-        m = re.search(r"-?\d+(?:\.\d+)?", s)
+        m = _SAFE_FLOAT_RE.search(s)
         return float(m.group(0)) if m else 0.0
     except Exception:
         return 0.0
 
 def extract_period_dates(period_str: str) -> Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]:
-    match = re.match(r'(\d{1,2})/(\d{1,2})\s*[-/]\s*(\d{1,2})[-/](\d{1,2})[-/](\d{4})', period_str)
+    match = _PERIOD_RANGE_RE.match(period_str)
     if match:
         return ((int(match.group(1)), int(match.group(2)), int(match.group(5))), 
                 (int(match.group(3)), int(match.group(4)), int(match.group(5))))
@@ -36,7 +250,7 @@ def extract_period_dates(period_str: str) -> Optional[Tuple[Tuple[int, int, int]
 
 def extract_single_date(date_str: str) -> Optional[Tuple[int, int, int]]:
     """Extract single date from MM/DD/YYYY format (for Hours & Payment style)"""
-    match = re.match(r'(\d{1,2})/(\d{1,2})/(\d{2,4})', date_str)
+    match = _SLASH_DATE_RE.match(date_str)
     if match:
         month, day, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
         if year < 100: year += 2000
@@ -44,58 +258,71 @@ def extract_single_date(date_str: str) -> Optional[Tuple[int, int, int]]:
     return None
 
 def parse_admin_fee_eff_date(text: str) -> Optional[Tuple[int, int, int]]:
-    match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{2,4})', text)
+    match = _SLASH_DATE_RE.search(text)
     if match:
         month, day, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
         if year < 100: year += 2000
         return (month, day, year)
     return None
 
-def find_admin_fee_eff(sheet, header_row: int, search_rows: int = 10) -> list:
-    """Find ALL 'Admin Fee Eff' entries - search ALL columns"""
+def find_admin_fee_rates(sheet, header_row: int, search_rows: int = 10) -> Tuple[list, float]:
+    """Find ALL 'Admin Fee Eff' entries and the static 'Admin Fee' above a header.
+
+    Returns (sorted [(date_tuple, rate), ...], first static rate or 0.0).
+    """
     admin_fees = []
+    static_rate = 0.0
     search_start = max(0, header_row - search_rows)
+    ncols = sheet.ncols
+    cell_value = sheet.cell_value
     
-    for r in range(search_start, header_row):
-        for c in range(sheet.ncols):
-            cell_val = sheet.cell_value(r, c)
-            if cell_val and "admin fee eff" in str(cell_val).lower():
-                date_tuple = parse_admin_fee_eff_date(str(cell_val))
-                if date_tuple and c + 1 < sheet.ncols:
-                    rate = safe_float(sheet.cell_value(r, c + 1))
-                    if rate > 0:
-                        admin_fees.append((date_tuple, rate))
+    for r, c in _label_cells(sheet, 'eff', search_start, header_row):
+        date_tuple = parse_admin_fee_eff_date(str(cell_value(r, c)))
+        if date_tuple and c + 1 < ncols:
+            rate = safe_float(cell_value(r, c + 1))
+            if rate > 0:
+                admin_fees.append((date_tuple, rate))
+    
+    for r, c in _label_cells(sheet, 'static', search_start, header_row):
+        if c + 1 < ncols:
+            rate = safe_float(cell_value(r, c + 1))
+            if rate > 0:
+                static_rate = rate
+                break
     
     admin_fees.sort(key=lambda x: (x[0][2], x[0][0], x[0][1]))
-    return admin_fees
+    return admin_fees, static_rate
+
+def find_admin_fee_eff(sheet, header_row: int, search_rows: int = 10) -> list:
+    """Find ALL 'Admin Fee Eff' entries - search ALL columns"""
+    return find_admin_fee_rates(sheet, header_row, search_rows)[0]
 
 def find_static_admin_fee(sheet, header_row: int, search_rows: int = 10) -> float:
     """Find static 'Admin Fee' - search ALL columns"""
-    search_start = max(0, header_row - search_rows)
-    
-    for r in range(search_start, header_row):
-        for c in range(sheet.ncols):
-            cell_val = sheet.cell_value(r, c)
-            if cell_val:
-                text = str(cell_val).lower().strip()
-                if text in ('admin fee', 'adminfee') and 'eff' not in text:
-                    if c + 1 < sheet.ncols:
-                        rate = safe_float(sheet.cell_value(r, c + 1))
-                        if rate > 0:
-                            return rate
-    return 0.0
-
-def get_rate_for_date(admin_fees: list, period_date: Tuple[int, int, int]) -> float:
-    """Get applicable rate for a specific date"""
-    applicable_rate = 0.0
+    return find_admin_fee_rates(sheet, header_row, search_rows)[1]
+
+def build_rate_index(admin_fees: list) -> Tuple[List[Tuple[int, int, int]], List[float]]:
+    """Running-max (year, month, day) Eff keys and their rates, for get_rate_for_date.
+
+    The list is scanned in its own order (a prepended static entry can sit
+    ahead of earlier Eff dates), so each bound is the max key seen so far.
+    """
+    bounds, rates = [], []
+    top = None
     for date_tuple, rate in admin_fees:
-        eff_comp = (date_tuple[2], date_tuple[0], date_tuple[1])
-        period_comp = (period_date[2], period_date[0], period_date[1])
-        if eff_comp <= period_comp:
-            applicable_rate = rate
-        else:
-            break
-    return applicable_rate
+        key = (date_tuple[2], date_tuple[0], date_tuple[1])
+        if top is None or key > top:
+            top = key
+        bounds.append(top)
+        rates.append(rate)
+    return bounds, rates
+
+def get_rate_for_date(admin_fees: list, period_date: Tuple[int, int, int], index=None) -> float:
+    """Get applicable rate for a specific date (index: build_rate_index(admin_fees))"""
+    bounds, rates = index if index is not None else build_rate_index(admin_fees)
+    # Rate of the last entry before the first Eff date past the period
+    i = bisect.bisect_right(bounds, (period_date[2], period_date[0], period_date[1]))
+    return rates[i - 1] if i else 0.0
 
 def is_full_month_period(start_date: Tuple[int, int, int], end_date: Tuple[int, int, int]) -> bool:
     """Check if period is a full month (starts on 1st, ends on 28+)"""
@@ -122,88 +349,130 @@ def get_full_month_eff_rate(admin_fees_list: list, month: int) -> float:
             latest_rate = rate
     return latest_rate
 
-def calculate_admin_fee_for_paysheet(paysheet_path: str, month: int, year: int, debug: bool = False) -> Tuple[float, float, float]:
+def section_totals(single: List[bool], values: List[float], rates: List[float]) -> Tuple[float, float, float]:
+    """(hours, fee, last rate) of a section's in-month period rows.
+
+    A Work Period row (single False) adds its hours and hours × rate when
+    that fee is positive; an Hours & Payment row (single True) adds one entry
+    and its amount when a rate applies. Sums run in row order.
+    """
+    hours_sum = 0.0
+    fee_sum = 0.0
+    last_rate = 0.0
+    for is_single, value, rate in zip(single, values, rates):
+        if is_single:
+            if rate > 0.0:
+                hours_sum += 1.0
+                fee_sum += value
+                last_rate = rate
+        elif rate > 0.0:
+            fee = value * rate
+            if fee > 0.0:
+                hours_sum += value
+                fee_sum += fee
+                last_rate = rate
+    return hours_sum, fee_sum, last_rate
+
+def find_section_ends(sheet: SheetSnapshot, headers: List[Tuple[int, int, str]]) -> List[int]:
+    """End row (exclusive) of each header's section.
+
+    A section ends at the first non-empty cell below its header, in the
+    header's column, that is a total/admin fees/deductions row or (when
+    another header follows) sits within 5 rows of the next header.
+    Each header column is swept once; the ends are then bisected.
+    """
+    filled: Dict[int, List[int]] = {}
+    enders: Dict[int, List[int]] = {}
+    for _, col, _ in headers:
+        if col in filled:
+            continue
+        filled[col] = [r for r in range(sheet.nrows) if sheet.values[r][col]]
+        enders[col] = [r for r in filled[col] if _SECTION_END_RE.search(sheet.text_lc[r][col])]
+    
+    ends = []
+    for idx, (hp_row, hp_col, _) in enumerate(headers):
+        end = sheet.nrows
+        rows = enders[hp_col]
+        i = bisect.bisect_right(rows, hp_row)
+        if i < len(rows):
+            end = rows[i]
+        if idx < len(headers) - 1:
+            rows = filled[hp_col]
+            i = bisect.bisect_left(rows, max(hp_row + 1, headers[idx + 1][0] - 5))
+            if i < len(rows):
+                end = min(end, rows[i])
+        ends.append(end)
+    return ends
+
+def calculate_admin_fee_for_paysheet(paysheet_path: str, month: int, year: int, debug: bool = False,
+                                     log: Callable[[str], None] = print,
+                                     on_error: Optional[Callable[[str, Exception], None]] = None) -> Tuple[float, float, float]:
     """
     v18b UPDATED - Now handles BOTH:
     1. "Work Period" header (period ranges: MM/DD-MM/DD/YYYY)
     2. "Hours & Payment" header (single dates: MM/DD/YYYY with amounts)
+
+    Debug lines go to log. A failure returns zeros; on_error, if given, is
+    called with the path and exception from inside the except block,
+    otherwise the error is logged in debug mode.
     """
     total_hours = 0.0
     total_admin_fee = 0.0
     last_rate = 0.0
     
     try:
-        book = xlrd.open_workbook(paysheet_path, formatting_info=False)
-        sheet = None
-        for s in book.sheets():
-            if year_in_sheet_name(year, s.name):
-                sheet = s
-                break
+        sheet = load_year_sheet(paysheet_path, year)
         if not sheet:
             return 0.0, 0.0, 0.0
         
         # ✅ UPDATED: Find BOTH "Work Period" AND "Hours & Payment" headers
         headers = []
-        for r in range(sheet.nrows):
-            for c in range(sheet.ncols):
-                val = sheet.cell_value(r, c)
-                if val:
-                    text = str(val).lower().strip()
-                    if text == 'work period' or text == 'hours & payment':
-                        headers.append((r, c, text))
-                        break
+        for r, c in _label_cells(sheet, 'header', 0, sheet.nrows):
+            if headers and headers[-1][0] == r:
+                continue  # first header cell in a row wins
+            headers.append((r, c, sheet.text_lc[r][c]))
         
         if not headers:
             return 0.0, 0.0, 0.0
         
+        # Both period formats lead with the month ("3/..", "03/.."), so rows
+        # for other months are skipped before the date regexes run
+        month_prefixes = (f"{month}/", f"0{month}/") if month < 10 else (f"{month}/",)
+        
+        section_ends = find_section_ends(sheet, headers)
+        
         for section_idx, (hp_row, hp_col, header_type) in enumerate(headers):
-            section_end = sheet.nrows
-            
-            for r in range(hp_row + 1, sheet.nrows):
-                cell_val = sheet.cell_value(r, hp_col)
-                if not cell_val:
-                    continue
-                cell_str = str(cell_val).strip().lower()
-                
-                if any(x in cell_str for x in ['total', 'admin fees', 'deductions']):
-                    section_end = r
-                    break
-                
-                if section_idx < len(headers) - 1:
-                    next_hp_row = headers[section_idx + 1][0]
-                    if r >= next_hp_row - 5:
-                        section_end = r
-                        break
+            section_end = section_ends[section_idx]
             
             if debug:
-                print(f"\n=== SECTION {section_idx + 1} ({header_type}) ===")
-                print(f"Header at Row {hp_row}, Col {hp_col}")
-                print(f"Section ends at Row {section_end}")
+                log(f"\n=== SECTION {section_idx + 1} ({header_type}) ===")
+                log(f"Header at Row {hp_row}, Col {hp_col}")
+                log(f"Section ends at Row {section_end}")
             
-            admin_fees_list = find_admin_fee_eff(sheet, hp_row, search_rows=10)
-            static_rate = find_static_admin_fee(sheet, hp_row, search_rows=10)
+            admin_fees_list, static_rate = find_admin_fee_rates(sheet, hp_row, search_rows=10)
             
             if admin_fees_list and static_rate > 0:
                 admin_fees_list = [((1, 1, year), static_rate)] + admin_fees_list
                 if debug:
-                    print(f"Found static Admin Fee ${static_rate:.2f} + Eff entries: {admin_fees_list}")
+                    log(f"Found static Admin Fee ${static_rate:.2f} + Eff entries: {admin_fees_list}")
             elif admin_fees_list and debug:
-                print(f"Found Admin Fee Eff entries: {admin_fees_list}")
+                log(f"Found Admin Fee Eff entries: {admin_fees_list}")
             
             if admin_fees_list:
-                section_hours = 0.0
-                section_fee = 0.0
-                section_rate = 0.0
-                
                 # Check if there's a mid-month Eff date
                 has_mid_month = has_mid_month_eff(admin_fees_list, month)
                 full_month_eff_rate = get_full_month_eff_rate(admin_fees_list, month)
+                rate_index = build_rate_index(admin_fees_list)
+                
+                # In-month rows as parallel lists; section_totals does the arithmetic
+                row_single, row_values, row_rates = [], [], []
                 
                 for r in range(hp_row + 1, section_end):
-                    period_text = sheet.cell_value(r, hp_col)
-                    if not period_text:
+                    if not sheet.values[r][hp_col]:
+                        continue
+                    period_str = sheet.text_lc[r][hp_col]
+                    if not period_str.startswith(month_prefixes):
                         continue
-                    period_str = str(period_text).strip().lower()
                     
                     # ✅ UPDATED: Handle BOTH period formats
                     period_dates = extract_period_dates(period_str)
@@ -223,25 +492,25 @@ def calculate_admin_fee_for_paysheet(paysheet_path: str, month: int, year: int,
                             continue
                         
                         # ✅ CORRECTED LOGIC:
-                        if is_full_month_period(start_date, end_date) and has_mid_month:
+                        full_month = is_full_month_period(start_date, end_date) and has_mid_month
+                        if full_month:
                             # Full month with mid-month Eff: use Eff rate for entire month
                             rate = full_month_eff_rate
-                            fee = hours_val * rate if rate > 0 else 0.0
-                            if debug:
-                                print(f"    Full month (use Eff rate ${{rate:.2f}}): {hours_val} hrs × ${rate:.2f} = ${fee:.2f}")
                         else:
                             # Weekly/partial or no mid-month Eff: use period start date
-                            rate = get_rate_for_date(admin_fees_list, start_date)
-                            fee = hours_val * rate if rate > 0 else 0.0
-                            if debug:
-                                print(f"    Period (start date): {hours_val} hrs × ${rate:.2f} = ${fee:.2f}")
+                            rate = get_rate_for_date(admin_fees_list, start_date, rate_index)
+                        row_single.append(False)
+                        row_values.append(hours_val)
+                        row_rates.append(rate)
                         
-                        if fee > 0:
-                            section_hours += hours_val
-                            section_fee += fee
-                            section_rate = rate
-                            if debug:
-                                print(f"  Row {r}: {period_str} | {hours_val} hrs | ${fee:.2f}")
+                        if debug:
+                            fee = hours_val * rate if rate > 0 else 0.0
+                            if full_month:
+                                log(f"    Full month (use Eff rate ${{rate:.2f}}): {hours_val} hrs × ${rate:.2f} = ${fee:.2f}")
+                            else:
+                                log(f"    Period (start date): {hours_val} hrs × ${rate:.2f} = ${fee:.2f}")
+                            if fee > 0:
+                                log(f"  Row {r}: {period_str} | {hours_val} hrs | ${fee:.2f}")
                     
                     # ✅ NEW: HOURS & PAYMENT LOGIC (single dates)
                     elif single_date:
@@ -249,40 +518,39 @@ def calculate_admin_fee_for_paysheet(paysheet_path: str, month: int, year: int,
                             continue
                         
                         # For "Hours & Payment": column +1 is the AMOUNT (not hours count)
-                        # Amount is already the billable/fee value
+                        # Amount is already the billable/fee value, counted as 1 entry
                         amount_val = safe_float(sheet.cell_value(r, hp_col + 1))
                         
                         if amount_val <= 0:
                             continue
                         
                         # Get rate for this date to determine if it applies
-                        rate = get_rate_for_date(admin_fees_list, single_date)
+                        rate = get_rate_for_date(admin_fees_list, single_date, rate_index)
+                        row_single.append(True)
+                        row_values.append(amount_val)
+                        row_rates.append(rate)
                         
-                        if rate > 0:
-                            # Use amount as the fee directly (already calculated in paysheet)
-                            fee = amount_val
-                            section_hours += 1  # Count as 1 entry (not actual hours)
-                            section_fee += fee
-                            section_rate = rate
-                            if debug:
-                                print(f"  Row {r}: {period_str} | Amount ${amount_val:.2f} | Rate ${rate:.2f}")
+                        if debug and rate > 0:
+                            log(f"  Row {r}: {period_str} | Amount ${amount_val:.2f} | Rate ${rate:.2f}")
                 
+                section_hours, section_fee, section_rate = section_totals(row_single, row_values, row_rates)
                 if section_hours > 0:
                     total_hours += section_hours
                     total_admin_fee += section_fee
                     last_rate = section_rate
                     if debug:
-                        print(f"✓ Section Total: {section_hours:.2f} hrs | ${section_fee:.2f}")
+                        log(f"✓ Section Total: {section_hours:.2f} hrs | ${section_fee:.2f}")
                 continue
             
             if static_rate > 0:
                 section_hours = 0.0
                 
                 for r in range(hp_row + 1, section_end):
-                    period_text = sheet.cell_value(r, hp_col)
-                    if not period_text:
+                    if not sheet.values[r][hp_col]:
+                        continue
+                    period_str = sheet.text_lc[r][hp_col]
+                    if not period_str.startswith(month_prefixes):
                         continue
-                    period_str = str(period_text).strip().lower()
                     
                     period_dates = extract_period_dates(period_str)
                     if not period_dates:
@@ -302,27 +570,32 @@ def calculate_admin_fee_for_paysheet(paysheet_path: str, month: int, year: int,
                     total_admin_fee += section_fee
                     last_rate = static_rate
                     if debug:
-                        print(f"✓ Found static 'Admin Fee' (${static_rate:.2f}/hr) | {section_hours:.2f} hrs | ${section_fee:.2f}")
+                        log(f"✓ Found static 'Admin Fee' (${static_rate:.2f}/hr) | {section_hours:.2f} hrs | ${section_fee:.2f}")
         
         if debug:
-            print(f"\n=== TOTAL ===")
-            print(f"Hours: {total_hours:.2f} | Last Rate: ${last_rate:.2f} | Fee: ${total_admin_fee:.2f}")
+            log(f"\n=== TOTAL ===")
+            log(f"Hours: {total_hours:.2f} | Last Rate: ${last_rate:.2f} | Fee: ${total_admin_fee:.2f}")
         
         return float(total_hours), float(last_rate), float(total_admin_fee)
     
     except Exception as e:
-        if debug:
-            print(f"ERROR: {e}")
+        if on_error is not None:
+            on_error(paysheet_path, e)
+        elif debug:
+            log(f"ERROR: {e}")
         return 0.0, 0.0, 0.0
 
 if __name__ == "__main__":
+    if not SUPPORT_XLS and not SUPPORT_CALAMINE:
+        print("ERROR: xlrd not available")
+        sys.exit(1)
     parser = argparse.ArgumentParser(description="Admin Fee v18b - Corrected logic with Hours & Payment support")
     parser.add_argument("--paysheet", required=True, help="Paysheet file path")
     parser.add_argument("--month", required=True, choices=MONTHS, help="Month name")
     parser.add_argument("--year", type=int, required=True, help="Year")
     parser.add_argument("--debug", action="store_true", help="Debug output")
     args = parser.parse_args()
-    month_idx = MONTHS.index(args.month) + 1
+    month_idx = MONTH_INDEX[args.month]
     hours, rate, fee = calculate_admin_fee_for_paysheet(args.paysheet, month_idx, args.year, args.debug)
     print(f"Total Hours: {float(hours)}")
     print(f"Rate Used: ${float(rate):.2f}")
@@ -19,11 +19,17 @@ if 'sklearn' in sys.modules:
     del sys.modules['sklearn']
 
 import json
+import multiprocessing
+import re
+import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import date, datetime
 from typing import List, Tuple
 
+from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt
 
@@ -33,15 +39,24 @@ except:
     AccrualUpdater = None
 
 try:
-    from admin_fee_module_v18b import calculate_admin_fee_for_paysheet
+    from admin_fee_module_v18b import calculate_admin_fee_for_paysheet, iter_paysheet_files
     ADMIN_FEE_AVAILABLE = True
 except:
     ADMIN_FEE_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 MONTHS = ["January", "February", "March", "April", "May", "June",
           "July", "August", "September", "October", "November", "December"]
+MONTH_INDEX = {name: i for i, name in enumerate(MONTHS, 1)}  # "January" -> 1
 CONFIG_FILE = "gui_config.json"
 LOGO_PATH = "itech_logo.png"
+# "<name>_123456.xls" / ".xlsx" -> file number (any case, like the folder walk)
+FILE_NUM_RE = re.compile(r'_(\d{6})\.xls', re.IGNORECASE)
 
 COLORS = {
     "bg_main": "#2d2d2d",
@@ -109,17 +124,17 @@ class DateModel(QtCore.QAbstractTableModel):
     def __init__(self):
         super().__init__()
         self.rows = []
+        # Formatted once on insert, one list per column: [MM/DD/YYYY], [multiplier]
+        self._display = [[], []]
+        # MM/DD/YY date per row for the accrual run
+        self._short = []
     def rowCount(self, parent=None):
         return len(self.rows)
     def columnCount(self, parent=None):
         return 2
     def data(self, index, role=Qt.DisplayRole):
         if role == Qt.DisplayRole:
-            d, m = self.rows[index.row()]
-            if index.column() == 0:
-                return d.strftime("%m/%d/%Y")
-            else:
-                return f"{m:.2f}"
+            return self._display[index.column()][index.row()]
         return None
     def headerData(self, section, orientation, role):
         if role == Qt.DisplayRole and orientation == Qt.Horizontal:
@@ -128,15 +143,45 @@ class DateModel(QtCore.QAbstractTableModel):
     def add_row(self, d, m):
         self.beginInsertRows(QtCore.QModelIndex(), len(self.rows), len(self.rows))
         self.rows.append((d, m))
+        self._display[0].append(d.strftime("%m/%d/%Y"))
+        self._display[1].append(f"{m:.2f}")
+        self._short.append(d.strftime("%m/%d/%y"))
         self.endInsertRows()
+    def load_rows(self, pairs):
+        """Replace all rows from (ISO date, multiplier) pairs in one model reset;
+        entries that don't parse are skipped"""
+        rows, display, short = [], [[], []], []
+        for d_str, m in pairs:
+            try:
+                d = datetime.fromisoformat(d_str).date()
+                texts = (d.strftime("%m/%d/%Y"), f"{m:.2f}", d.strftime("%m/%d/%y"))
+            except Exception:
+                continue
+            rows.append((d, m))
+            display[0].append(texts[0])
+            display[1].append(texts[1])
+            short.append(texts[2])
+        self.beginResetModel()
+        self.rows = rows
+        self._display = display
+        self._short = short
+        self.endResetModel()
     def remove_row(self, idx):
         if 0 <= idx < len(self.rows):
             self.beginRemoveRows(QtCore.QModelIndex(), idx, idx)
             self.rows.pop(idx)
+            self._display[0].pop(idx)
+            self._display[1].pop(idx)
+            self._short.pop(idx)
             self.endRemoveRows()
+    def accrual_pairs(self) -> List[Tuple[str, float]]:
+        """(MM/DD/YY, multiplier) pairs as AccrualUpdater takes them"""
+        return [(ds, m) for ds, (_, m) in zip(self._short, self.rows)]
     def clear(self):
         self.beginResetModel()
         self.rows = []
+        self._display = [[], []]
+        self._short = []
         self.endResetModel()
 
 
@@ -144,7 +189,7 @@ class RunnerThread(QtCore.QThread):
     log_signal = QtCore.Signal(str)
     done_signal = QtCore.Signal()
     error_signal = QtCore.Signal(str)
-    def __init__(self, master, paysheets, month, year, dry_run, enable_accrual, enable_admin_fee, pay_dates, enable_carryforward=False):
+    def __init__(self, master, paysheets, month, year, dry_run, enable_accrual, enable_admin_fee, pay_dates, enable_carryforward=False, workers=1):
         super().__init__()
         self.master = master
         self.paysheets = paysheets
@@ -153,18 +198,28 @@ class RunnerThread(QtCore.QThread):
         self.dry_run = dry_run
         self.enable_accrual = enable_accrual and AccrualUpdater is not None
         self.enable_admin_fee = enable_admin_fee and ADMIN_FEE_AVAILABLE
-        self.pay_dates = pay_dates
+        self.pay_dates = list(pay_dates)  # (MM/DD/YY, multiplier), see DateModel.accrual_pairs
         self.enable_carryforward = enable_carryforward
+        self.workers = workers  # paysheet processes: 1 → in this thread, 0 → one per CPU
+        self._log_buf: List[str] = []
+        self._log_flushed = time.monotonic()
+    def _log(self, line: str):
+        """Queue a log line; the UI gets them in batches (50 lines or 0.2 s).
+        Call _flush_log() before anything slow so queued lines aren't held back."""
+        self._log_buf.append(line)
+        if len(self._log_buf) >= 50 or time.monotonic() - self._log_flushed >= 0.2:
+            self._flush_log()
+    def _flush_log(self):
+        if self._log_buf:
+            self.log_signal.emit("\n".join(self._log_buf))
+            self._log_buf.clear()
+        self._log_flushed = time.monotonic()
     def run(self):
         try:
             if self.enable_accrual:
-                self.log_signal.emit("\n" + "="*80)
-                self.log_signal.emit("STEP 1: ACCRUAL UPDATE (Hours, Billed, Pay Dates)")
-                self.log_signal.emit("="*80 + "\n")
-                date_multiplier_pairs = []
-                for d, m in self.pay_dates:
-                    date_str = d.strftime("%m/%d/%y")
-                    date_multiplier_pairs.append((date_str, m))
+                self._log("\n" + "="*80)
+                self._log("STEP 1: ACCRUAL UPDATE (Hours, Billed, Pay Dates)")
+                self._log("="*80 + "\n")
                 updater = AccrualUpdater(
                     master_path=self.master,
                     sheet_name="Profit Sharing",
@@ -172,66 +227,87 @@ class RunnerThread(QtCore.QThread):
                     month=self.month,
                     year=self.year,
                     paysheets_folder=self.paysheets,
-                    date_multiplier_pairs=date_multiplier_pairs,
+                    date_multiplier_pairs=self.pay_dates,
                     dry_run=self.dry_run,
                     backup=True,
                     enable_carryforward=self.enable_carryforward,
+                    workers=self.workers,
                 )
+                self._flush_log()
                 result = updater.process()
                 for line in updater.log_lines:
-                    self.log_signal.emit(line)
+                    self._log(line)
             if self.enable_admin_fee:
-                self.log_signal.emit("\n" + "="*80)
-                self.log_signal.emit("STEP 2: ADMIN FEE CALCULATION (Column T)")
-                self.log_signal.emit("="*80 + "\n")
-                from openpyxl import load_workbook
-                import re
-                month_idx = MONTHS.index(self.month) + 1
-                self.log_signal.emit(f"Loading master: {self.master}")
-                wb = load_workbook(self.master)
-                ws = wb['Profit Sharing']
-                self.log_signal.emit("✓ Loaded\n")
-                lookup = {}
-                for r in range(4, ws.max_row + 1):
-                    fn = ws.cell(row=r, column=1).value
-                    if fn:
-                        fn_str = str(fn).strip()
-                        if len(fn_str) == 6 and fn_str.isdigit():
-                            lookup[fn_str] = r
-                self.log_signal.emit(f"Found {len(lookup)} file numbers in master\n")
+                self._log("\n" + "="*80)
+                self._log("STEP 2: ADMIN FEE CALCULATION (Column T)")
+                self._log("="*80 + "\n")
+                month_idx = MONTH_INDEX[self.month]
+                self._log(f"Loading master: {self.master}")
+                # Dry runs only need the lookups, so a read-only pass will do; a
+                # real run reads them from the writable workbook it saves later
+                # instead of parsing the master twice
+                self._flush_log()
+                wb = None
+                if self.dry_run:
+                    wb_ro = load_workbook(self.master, read_only=True, keep_links=False)
+                else:
+                    wb = wb_ro = load_workbook(self.master)
+                try:
+                    ws_ro = wb_ro['Profit Sharing']
+                    self._log("✓ Loaded\n")
+                    lookup = {}
+                    for r, (fn,) in enumerate(ws_ro.iter_rows(min_row=4, max_row=ws_ro.max_row, max_col=1, values_only=True), 4):
+                        if type(fn) is int:
+                            # Numeric cells: the range check is the digit-count test
+                            if 100000 <= fn <= 999999:
+                                lookup[str(fn)] = r
+                        elif fn:
+                            fn_str = str(fn).strip()
+                            if len(fn_str) == 6 and fn_str.isdigit():
+                                lookup[fn_str] = r
+                    header = next(ws_ro.iter_rows(min_row=3, max_row=3, values_only=True), ())
+                finally:
+                    if wb is None:
+                        wb_ro.close()
+                self._log(f"Found {len(lookup)} file numbers in master\n")
                 files = []
                 paysheets_path = Path(self.paysheets)
-                self.log_signal.emit(f"Searching paysheets folder: {paysheets_path}\n")
+                self._log(f"Searching paysheets folder: {paysheets_path}\n")
                 try:
-                    for psheet in paysheets_path.rglob('*.xls'):
-                        files.append(str(psheet))
-                    for psheet in paysheets_path.rglob('*.xlsx'):
-                        files.append(str(psheet))
+                    files.extend(iter_paysheet_files(paysheets_path, ('.xls', '.xlsx')))
                 except Exception as e:
-                    self.log_signal.emit(f"❌ Error searching folders: {e}\n")
-                files = sorted(files)
-                self.log_signal.emit(f"Found {len(files)} paysheets (including subfolders)\n\n")
+                    self._log(f"❌ Error searching folders: {e}\n")
+                files.sort()  # [idx] numbering follows path order
+                self._log(f"Found {len(files)} paysheets (including subfolders)\n\n")
                 if len(files) == 0:
-                    self.log_signal.emit("❌ NO PAYSHEETS FOUND!\n")
+                    self._log("❌ NO PAYSHEETS FOUND!\n")
+                    self._flush_log()
                     self.done_signal.emit()
                     return
                 updated = 0
                 skipped = 0
                 # Dynamically find Admin Fee column from header row
                 T_COL = None
-                for c in range(1, ws.max_column + 1):
-                    v = ws.cell(row=3, column=c).value
+                for c, v in enumerate(header, 1):
                     if v and 'admin fee' in str(v).lower():
                         T_COL = c
                         break
                 if not T_COL:
-                    self.log_signal.emit("❌ Admin Fee column not found in header row 3")
+                    self._log("❌ Admin Fee column not found in header row 3")
+                    self._flush_log()
                     self.done_signal.emit()
                     return
-                self.log_signal.emit(f"✓ Admin Fee column: {__import__('openpyxl.utils', fromlist=['get_column_letter']).get_column_letter(T_COL)} ({T_COL})\n")
+                self._log(f"✓ Admin Fee column: {get_column_letter(T_COL)} ({T_COL})\n")
+                jobs = []  # (idx, paysheet, fname, master row)
+                # Bound once: these loops run per paysheet
+                basename = os.path.basename
+                find_num = FILE_NUM_RE.search
+                log = self._log
+                flush = self._flush_log
+                dry_run = self.dry_run
                 for idx, psheet in enumerate(files, 1):
-                    fname = os.path.basename(psheet)
-                    m = re.search(r'_(\d{6})\.xls', fname)
+                    fname = basename(psheet)
+                    m = find_num(fname)
                     if not m:
                         skipped += 1
                         continue
@@ -239,32 +315,61 @@ class RunnerThread(QtCore.QThread):
                     if file_number not in lookup:
                         skipped += 1
                         continue
-                    mrow = lookup[file_number]
-                    try:
-                        hours, rate, admin_fee = calculate_admin_fee_for_paysheet(
-                            paysheet_path=psheet,
-                            month=month_idx,
-                            year=self.year,
-                            debug=False
-                        )
-                        if isinstance(admin_fee, (int, float)) and admin_fee > 0:
-                            if not self.dry_run:
-                                ws.cell(row=mrow, column=T_COL).value = round(float(admin_fee), 2)
-                                updated += 1
-                            self.log_signal.emit(f"[{idx:3d}] {fname}: ${admin_fee:.2f}")
-                        else:
-                            skipped += 1
-                    except Exception as e:
-                        self.log_signal.emit(f"[{idx:3d}] ✗ {fname}: {str(e)[:60]}")
+                    jobs.append((idx, psheet, fname, lookup[file_number]))
+                # Paysheets are independent: compute them in worker processes up
+                # front, then log results here in file order
+                executor = None
+                pending = {}
+                writes = {}  # master row -> Column T value, applied after the loop
+                if self.workers != 1 and len(jobs) > 1:
+                    n_workers = min(self.workers or os.cpu_count() or 1, len(jobs))
+                    executor = ProcessPoolExecutor(max_workers=n_workers)
+                    for idx, psheet, _, _ in jobs:
+                        pending[idx] = executor.submit(
+                            calculate_admin_fee_for_paysheet, psheet, month_idx, self.year, False)
+                try:
+                    for idx, psheet, fname, mrow in jobs:
+                        try:
+                            if idx in pending:
+                                future = pending.pop(idx)
+                                if not future.done():
+                                    flush()
+                                hours, rate, admin_fee = future.result()
+                            else:
+                                flush()
+                                hours, rate, admin_fee = calculate_admin_fee_for_paysheet(
+                                    paysheet_path=psheet,
+                                    month=month_idx,
+                                    year=self.year,
+                                    debug=False
+                                )
+                            if isinstance(admin_fee, (int, float)) and admin_fee > 0:
+                                if not dry_run:
+                                    writes[mrow] = round(float(admin_fee), 2)
+                                    updated += 1
+                                log(f"[{idx:3d}] {fname}: ${admin_fee:.2f}")
+                            else:
+                                skipped += 1
+                        except Exception as e:
+                            log(f"[{idx:3d}] ✗ {fname}: {str(e)[:60]}")
+                finally:
+                    if executor is not None:
+                        executor.shutdown(cancel_futures=True)
                 if not self.dry_run:
+                    self._flush_log()
+                    cell = wb['Profit Sharing'].cell
+                    for mrow, value in writes.items():
+                        cell(row=mrow, column=T_COL).value = value
                     try:
                         wb.save(self.master)
-                        self.log_signal.emit(f"✓ Saved! Updated {updated}/{len(files)} admin fees\n")
+                        self._log(f"✓ Saved! Updated {updated}/{len(files)} admin fees\n")
                     except Exception as e:
-                        self.log_signal.emit(f"✗ Error saving: {e}\n")
+                        self._log(f"✗ Error saving: {e}\n")
+            self._flush_log()
             self.done_signal.emit()
         except Exception as e:
-            self.log_signal.emit(f"\n✗ ERROR: {e}\n{traceback.format_exc()}")
+            self._log(f"\n✗ ERROR: {e}\n{traceback.format_exc()}")
+            self._flush_log()
             self.error_signal.emit(str(e))
 
 
@@ -273,17 +378,30 @@ class MainWindow(QtWidgets.QMainWindow):
         super().__init__()
         self.setWindowTitle("iTech Accrual Updater")
         self.resize(900, 700)
-        self.setStyleSheet(STYLESHEET)
         self.runner = None
+        # _save() only (re)starts this timer, so a burst of edits is one write
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._write_config)
+        self._last_config = None  # bytes last written to CONFIG_FILE
         self._build_ui()
         self._load_config()
         QtCore.QTimer.singleShot(500, self._warm_dialogs)
 
+    def closeEvent(self, event):
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._write_config()
+        super().closeEvent(event)
+
     def _warm_dialogs(self):
         """Pre-initialize file dialogs to prevent first-click crash"""
         try:
             d = QtWidgets.QFileDialog(self)
             d.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+            # Construction is the warm-up; don't keep the probe alive as a child
+            d.deleteLater()
         except:
             pass
 
@@ -379,6 +497,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.carryforward_cb.setChecked(False)
         self.carryforward_cb.setToolTip("Carryforward runs automatically in January.\nTick this to force it for any other month.")
         opts.addWidget(self.carryforward_cb)
+        self.workers_spin = QtWidgets.QSpinBox()
+        self.workers_spin.setRange(0, 64)
+        self.workers_spin.setValue(1)
+        self.workers_spin.setPrefix("Workers: ")
+        self.workers_spin.setSpecialValueText("Workers: all CPUs")
+        self.workers_spin.setToolTip("Processes used to read paysheets.\n1 reads them in the app itself; more helps large folders.")
+        opts.addWidget(self.workers_spin)
         opts.addStretch()
         main_layout.addLayout(opts)
         self.run_btn = QtWidgets.QPushButton("RUN UPDATE")
@@ -458,14 +583,18 @@ class MainWindow(QtWidgets.QMainWindow):
             master, paysheets, self.month_combo.currentText(),
             self.year_spin.value(), self.dry_run.isChecked(),
             self.accrual_cb.isChecked(), self.admin_fee.isChecked(),
-            self.pd_model.rows,
+            self.pd_model.accrual_pairs(),
             enable_carryforward=self.carryforward_cb.isChecked(),
+            workers=self.workers_spin.value(),
         )
         self.runner.log_signal.connect(self.log.appendPlainText)
         self.runner.done_signal.connect(lambda: self.run_btn.setEnabled(True))
         self.runner.start()
 
     def _save(self):
+        self._save_timer.start()
+
+    def _write_config(self):
         try:
             cfg = {
                 "master": self.master_input.text(),
@@ -474,10 +603,18 @@ class MainWindow(QtWidgets.QMainWindow):
                 "year": self.year_spin.value(),
                 "dry_run": self.dry_run.isChecked(),
                 "carryforward": self.carryforward_cb.isChecked(),
+                "workers": self.workers_spin.value(),
                 "pay_dates": [(d.isoformat(), m) for d, m in self.pd_model.rows],
             }
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(cfg, f)
+            data = json.dumps(cfg).encode("utf-8")
+            if data == self._last_config:
+                return
+            # Write beside the file and swap it in, so a crash never truncates it
+            tmp = CONFIG_FILE + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, CONFIG_FILE)
+            self._last_config = data
         except:
             pass
 
@@ -485,29 +622,37 @@ class MainWindow(QtWidgets.QMainWindow):
         if not Path(CONFIG_FILE).exists():
             return
         try:
-            with open(CONFIG_FILE) as f:
-                cfg = json.load(f)
+            raw = Path(CONFIG_FILE).read_bytes()
+            cfg = None
+            if ORJSON_AVAILABLE:
+                try:
+                    cfg = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    pass  # e.g. NaN, which json.dumps writes but orjson rejects
+            if cfg is None:
+                cfg = json.loads(raw)
             self.master_input.setText(cfg.get("master", ""))
             self.paysheets_input.setText(cfg.get("paysheets", ""))
             self.month_combo.setCurrentIndex(cfg.get("month", 0))
             self.year_spin.setValue(cfg.get("year", datetime.now().year))
             self.dry_run.setChecked(cfg.get("dry_run", True))
             self.carryforward_cb.setChecked(cfg.get("carryforward", False))
-            for d_str, m in cfg.get("pay_dates", []):
-                try:
-                    self.pd_model.add_row(datetime.fromisoformat(d_str).date(), m)
-                except:
-                    pass
+            self.workers_spin.setValue(cfg.get("workers", 1))
+            self.pd_model.load_rows(cfg.get("pay_dates", []))
         except:
             pass
 
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
+    # Application-wide sheet: set before any widget exists, so each widget is
+    # polished once against one shared rule set (dialogs included)
+    app.setStyleSheet(STYLESHEET)
     win = MainWindow()
     win.show()
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # admin fee worker processes in frozen builds
     main()
@@ -8,15 +8,23 @@ Usage:
   - Call mgr.add_profile(...), mgr.edit_profile(...), mgr.delete_profile(name) to manage profiles
 Profiles are saved to 'company_profiles.json' in the app working directory.
 """
+import hashlib
 import json
+import os
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import date, datetime
 
+try:
+    import orjson
+    SUPPORT_ORJSON = True
+except ImportError:
+    SUPPORT_ORJSON = False
+
 PROFILES_FILE = "company_profiles.json"
 
-@dataclass
+@dataclass(slots=True)
 class CompanyProfile:
     name: str
     master: str = ""
@@ -54,15 +62,20 @@ class CompanyManager:
         self.path = Path(path)
         self.profiles: Dict[str, CompanyProfile] = {}
         self.current: Optional[str] = None
+        self._last_hash: Optional[bytes] = None  # digest of the last payload written
 
     def load(self):
+        self._last_hash = None
         if not self.path.exists():
             self.profiles = {}
             self.current = None
             return
         try:
-            with open(self.path, "r", encoding="utf-8") as fh:
-                raw = json.load(fh)
+            if SUPPORT_ORJSON:
+                raw = orjson.loads(self.path.read_bytes())
+            else:
+                with open(self.path, "r", encoding="utf-8") as fh:
+                    raw = json.load(fh)
             self.profiles = {p["name"]: CompanyProfile.from_dict(p) for p in raw.get("profiles", [])}
             self.current = raw.get("current")
             if self.current not in self.profiles:
@@ -77,8 +90,20 @@ class CompanyManager:
                 "profiles": [p.to_dict() for p in self.profiles.values()],
                 "current": self.current
             }
-            with open(self.path, "w", encoding="utf-8") as fh:
-                json.dump(payload, fh, indent=2)
+            if SUPPORT_ORJSON:
+                data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if digest == self._last_hash:
+                return  # nothing changed since the last save
+            # Write beside the target and swap it in, so a crash mid-save never
+            # leaves a truncated profiles file behind
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, self.path)
+            self._last_hash = digest
         except Exception:
             raise
 
@@ -92,6 +117,8 @@ class CompanyManager:
         return self.get_profile(self.current) if self.current else None
 
     def set_current(self, name: str):
+        if name == self.current:
+            return
         if name in self.profiles:
             self.current = name
             self.save()
@@ -1,6 +1,7 @@
 """
 PyInstaller entry point. Starts uvicorn, opens browser, blocks until closed.
 """
+import multiprocessing
 import os
 import sys
 import threading
@@ -54,4 +55,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # admin fee worker processes in the frozen build
     main()
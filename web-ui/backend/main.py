@@ -9,6 +9,7 @@ import re
 import sys
 import traceback
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -60,16 +61,27 @@ except Exception as e:
     ACCRUAL_AVAILABLE = False
 
 try:
-    from admin_fee_module_v18b import calculate_admin_fee_for_paysheet  # type: ignore
+    from admin_fee_module_v18b import calculate_admin_fee_for_paysheet, iter_paysheet_files  # type: ignore
     ADMIN_FEE_AVAILABLE = True
 except Exception:
     ADMIN_FEE_AVAILABLE = False
 
 
+# Worker processes for the admin fee pass; 1 → in-process (default), 0 → one
+# per CPU. A bad or negative ACCRUAL_WORKERS falls back to 1 rather than
+# blocking startup.
+try:
+    ADMIN_FEE_WORKERS = int(os.environ.get("ACCRUAL_WORKERS", "1") or 1)
+except ValueError:
+    ADMIN_FEE_WORKERS = 1
+if ADMIN_FEE_WORKERS < 0:
+    ADMIN_FEE_WORKERS = 1
+
 MONTHS = [
     "January", "February", "March", "April", "May", "June",
     "July", "August", "September", "October", "November", "December",
 ]
+MONTH_INDEX = {name: i for i, name in enumerate(MONTHS, 1)}  # "January" -> 1
 
 
 app = FastAPI(title="iTech Accrual Updater API")
@@ -515,7 +527,7 @@ def _run_admin_fee(req: RunRequest, job_id: str, loop: asyncio.AbstractEventLoop
     import xlwings as xw  # type: ignore
     from accrual_updater import find_headers  # type: ignore
 
-    month_idx = MONTHS.index(req.month) + 1
+    month_idx = MONTH_INDEX[req.month]
     HEADER_ROW = 3
 
     # Read-only pass with openpyxl — just to detect headers + build lookup
@@ -526,9 +538,15 @@ def _run_admin_fee(req: RunRequest, job_id: str, loop: asyncio.AbstractEventLoop
     admin_col = headers.get('admin_fee_col')
 
     lookup: Dict[str, int] = {}
-    for r in range(HEADER_ROW + 1, ws_read.max_row + 1):
-        fn = ws_read.cell(row=r, column=file_col).value
-        if fn:
+    # One iter_rows sweep: ws.cell() on a read-only sheet re-walks the XML per call
+    rows = ws_read.iter_rows(min_row=HEADER_ROW + 1, max_row=ws_read.max_row,
+                             min_col=file_col, max_col=file_col, values_only=True)
+    for r, (fn,) in enumerate(rows, HEADER_ROW + 1):
+        if type(fn) is int:
+            # Numeric cells: the range check is the digit-count test
+            if 10000 <= fn <= 999999:
+                lookup[str(fn)] = r
+        elif fn:
             fn_str = str(fn).strip()
             if 5 <= len(fn_str) <= 6 and fn_str.isdigit():
                 lookup[fn_str] = r
@@ -541,17 +559,12 @@ def _run_admin_fee(req: RunRequest, job_id: str, loop: asyncio.AbstractEventLoop
         return
     _push_log_sync(job_id, f"✓ Admin Fee column: {get_column_letter(admin_col)} ({admin_col})", loop)
 
-    files: List[str] = []
-    psheets = Path(req.paysheets_folder)
-    for p in psheets.rglob("*.xls"):
-        files.append(str(p))
-    for p in psheets.rglob("*.xlsx"):
-        files.append(str(p))
-    files.sort()
+    files: List[str] = sorted(iter_paysheet_files(req.paysheets_folder, (".xls", ".xlsx")))
 
     # Compute all admin-fee values first
     to_write: List[Tuple[int, float, str]] = []  # (row, value, fname)
     skipped = 0
+    jobs: List[Tuple[int, str, str, int]] = []  # (idx, paysheet, fname, master row)
     for idx, psheet in enumerate(files, 1):
         fname = os.path.basename(psheet)
         m = re.search(r"(\d{5,6})", fname)
@@ -562,18 +575,37 @@ def _run_admin_fee(req: RunRequest, job_id: str, loop: asyncio.AbstractEventLoop
         if file_number not in lookup:
             skipped += 1
             continue
-        mrow = lookup[file_number]
-        try:
-            hours, rate, admin_fee = calculate_admin_fee_for_paysheet(
-                paysheet_path=psheet, month=month_idx, year=req.year, debug=False
-            )
-            if isinstance(admin_fee, (int, float)) and admin_fee > 0:
-                to_write.append((mrow, round(float(admin_fee), 2), fname))
-                _push_log_sync(job_id, f"[{idx:3d}] {fname}: ${admin_fee:.2f}", loop)
-            else:
-                skipped += 1
-        except Exception as e:
-            _push_log_sync(job_id, f"[{idx:3d}] ✗ {fname}: {str(e)[:60]}", loop)
+        jobs.append((idx, psheet, fname, lookup[file_number]))
+
+    # Paysheets are independent: submit them all to a process pool, then log
+    # the results in file order so the output matches a sequential run
+    executor = None
+    pending: Dict[int, Any] = {}
+    if ADMIN_FEE_WORKERS != 1 and len(jobs) > 1:
+        n_workers = min(ADMIN_FEE_WORKERS or os.cpu_count() or 1, len(jobs))
+        executor = ProcessPoolExecutor(max_workers=n_workers)
+        for idx, psheet, _, _ in jobs:
+            pending[idx] = executor.submit(
+                calculate_admin_fee_for_paysheet, psheet, month_idx, req.year, False)
+    try:
+        for idx, psheet, fname, mrow in jobs:
+            try:
+                if idx in pending:
+                    hours, rate, admin_fee = pending.pop(idx).result()
+                else:
+                    hours, rate, admin_fee = calculate_admin_fee_for_paysheet(
+                        paysheet_path=psheet, month=month_idx, year=req.year, debug=False
+                    )
+                if isinstance(admin_fee, (int, float)) and admin_fee > 0:
+                    to_write.append((mrow, round(float(admin_fee), 2), fname))
+                    _push_log_sync(job_id, f"[{idx:3d}] {fname}: ${admin_fee:.2f}", loop)
+                else:
+                    skipped += 1
+            except Exception as e:
+                _push_log_sync(job_id, f"[{idx:3d}] ✗ {fname}: {str(e)[:60]}", loop)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
     if req.dry_run or not to_write:
         _push_log_sync(job_id, f"(dry) {len(to_write)} admin fees ready, {skipped} skipped", loop)